@@ -1,20 +1,79 @@
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from typing import Any, Optional, Dict
 
-from cachetools import TTLCache
+from cachetools import LRUCache
+import gzip
+import hashlib
 import os
 import pickle
+import sys
 import httpx
-import hashlib
-import json
 import logging
+import orjson
+import sqlite3
+import tempfile
+import time
+import xxhash
+import zstandard as zstd
 from pathlib import Path
 
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Settings snapshotted at import time: pydantic attribute access goes through
+# descriptor dispatch, which is measurable in per-request paths like
+# _cache_for. Call refresh_settings_snapshot() after mutating `settings`.
+_PREWARM_CLUB_ID = settings.PREWARM_CLUB_ID
+_PREWARM_INTERVAL_SECONDS = settings.PREWARM_INTERVAL_SECONDS
+_CACHE_FSYNC_MODE = settings.CACHE_FSYNC_MODE
+
+
+def refresh_settings_snapshot() -> None:
+    """Re-captures the module-level settings snapshot (tests, hot reload)."""
+    global _PREWARM_CLUB_ID, _PREWARM_INTERVAL_SECONDS, _CACHE_FSYNC_MODE
+    _PREWARM_CLUB_ID = settings.PREWARM_CLUB_ID
+    _PREWARM_INTERVAL_SECONDS = settings.PREWARM_INTERVAL_SECONDS
+    _CACHE_FSYNC_MODE = settings.CACHE_FSYNC_MODE
+
+# Cached bodies are zstd-compressed on disk: HTML compresses roughly 4x, so
+# both the cache footprint and the bytes read back on a cold hit shrink
+# accordingly, while decompression runs at memory bandwidth. Old uncompressed
+# files are recognised by the missing frame magic and read as-is.
+_ZSTD_COMP = zstd.ZstdCompressor(level=3)
+_ZSTD_DECOMP = zstd.ZstdDecompressor()
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# In-process cache of decompressed body bytes, keyed by content file path.
+# Repeated cache hits for the same URL are served from memory instead of
+# re-reading (and re-decoding) the file on every access.
+_content_cache: "LRUCache[str, bytes]" = LRUCache(maxsize=128)
+
+# Long-lived HTTP client shared by all fetches. Reusing one client keeps the
+# connection pool (TCP + TLS) alive between requests instead of paying a new
+# handshake and DNS lookup per call, and lets callers overlap many fetches
+# with asyncio.gather over the same pool.
+_ASYNC_CLIENT = httpx.AsyncClient(
+    follow_redirects=True,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=httpx.Timeout(10.0),
+)
+
+
+# Single choke point for upstream concurrency: every live fetch (prewarm
+# fan-out, endpoint fan-out, detail hydration) acquires this before touching
+# the network, so callers can gather freely without amplifying tail latency
+# at fussball.de.
+_FETCH_SEM = asyncio.Semaphore(settings.MAX_CONCURRENCY)
+
+
+async def close_http_client():
+    """Closes the shared HTTP client. Called on application shutdown."""
+    await _ASYNC_CLIENT.aclose()
+
 
 @dataclass
 class HttpCacheEntry:
@@ -30,22 +89,46 @@ class HttpCacheEntry:
     text: Optional[str]
     etag: Optional[str] = None
     last_modified: Optional[str] = None
-    expires_at: Optional[datetime] = None
+    # Unix timestamp (time.time()); a float compare per lookup is far cheaper
+    # than constructing and comparing timezone-aware datetimes.
+    expires_at: Optional[float] = None
     content_file: Optional[str] = None
+    # Decoded body, memoized by load_text so repeated hits don't re-decode.
+    _cached_text: Optional[str] = None
+    # Consecutive failures observed for this URL (negative entries only).
+    failure_count: int = 0
 
     def load_content(self) -> Optional[bytes]:
-        if self.content_file and Path(self.content_file).exists():
-            return Path(self.content_file).read_bytes()
+        if not self.content_file:
+            return None
+        cached = _content_cache.get(self.content_file)
+        if cached is not None:
+            return cached
+        if Path(self.content_file).exists():
+            content = Path(self.content_file).read_bytes()
+            if content.startswith(_ZSTD_MAGIC):
+                try:
+                    content = _ZSTD_DECOMP.decompressobj().decompress(content)
+                except zstd.ZstdError:
+                    # A corrupt blob is indistinguishable from a miss for the
+                    # caller: drop it so the next fetch rewrites it.
+                    logger.warning("Corrupt cache file %s, discarding", self.content_file)
+                    Path(self.content_file).unlink(missing_ok=True)
+                    return None
+            _content_cache[self.content_file] = content
+            return content
         return None
 
     def load_text(self) -> Optional[str]:
+        if self._cached_text is not None:
+            return self._cached_text
         content = self.load_content()
         if content is not None:
             try:
-                return content.decode("utf-8")
+                self._cached_text = content.decode("utf-8")
             except UnicodeDecodeError:
                 return None
-        return None
+        return self._cached_text
 
 
 @dataclass
@@ -61,24 +144,218 @@ class FetchedResponse:
     text: Optional[str]
 
 
-# Unified HTTP response cache
-http_cache = TTLCache(maxsize=1024, ttl=settings.CACHE_TTL_GAMES)
+# Unified HTTP response cache. Plain LRU: freshness is decided solely by the
+# per-entry expires_at check in fetch_url, so TTLCache's own expiry
+# bookkeeping on every access would be redundant work.
+http_cache = LRUCache(maxsize=1024)
+
+# Failed fetches (4xx/5xx) live in their own small LRU so a flood of broken
+# URLs can never evict legitimate entries from http_cache. The TTL backs off
+# exponentially per consecutive failure (5s, 15s, 45s, capped at 300s) so a
+# persistently failing URL is not re-hammered.
+negative_cache: "LRUCache[str, HttpCacheEntry]" = LRUCache(maxsize=256)
+
+# Pinned tier for the prewarmed club: entries for URLs that belong to
+# settings.PREWARM_CLUB_ID live in this unbounded dict, so bursts of one-shot
+# traffic can never evict the hot set out of the LRU. The prewarmer refreshes
+# these before they expire.
+_pinned_cache: Dict[str, "HttpCacheEntry"] = {}
+
+
+def _cache_for(url: str):
+    """Returns the cache tier responsible for a URL."""
+    club_id = _PREWARM_CLUB_ID
+    if club_id and club_id in url:
+        return _pinned_cache
+    return http_cache
+
 
 # Object-level cache for full club info responses
-from .schemas import FullClubInfoResponse
+from .schemas import FullClubInfoResponse, Game, TeamWithDetails
 club_info_cache: Dict[str, FullClubInfoResponse] = {}
 
+# O(1) lookup indices over club_info_cache. The per-id endpoints used to walk
+# every cached club, team and game list on each request; these dicts make the
+# hit path a single hash lookup. Rebuilt whenever club_info_cache changes
+# (prewarm cycle, cache load).
+game_index: Dict[str, Game] = {}
+team_index: Dict[str, TeamWithDetails] = {}
+
+# Pre-serialized JSON payloads per prewarmed club, one blob per endpoint
+# projection ("full", "teams", "info", "next_games", "prev_games"). Warm hits
+# return these via Response() and skip the jsonable_encoder walk over every
+# team and game, which dominates CPU on large clubs.
+club_info_json_cache: Dict[str, Dict[str, bytes]] = {}
+
+# Gzipped variants of the blobs above, compressed once per prewarm cycle so a
+# warm hit from a gzip-capable client never re-compresses the same bytes.
+# Small payloads are skipped (mirrors the middleware's minimum_size).
+club_info_gzip_cache: Dict[str, Dict[str, bytes]] = {}
+
+_GZIP_MIN_SIZE = 1024
+
+# ETag per blob (quoted, as the header demands), computed once per prewarm
+# cycle. Polling clients that send If-None-Match get a body-less 304 back.
+club_info_etag_cache: Dict[str, Dict[str, str]] = {}
+
+
+def _build_club_json(cached: FullClubInfoResponse) -> Dict[str, bytes]:
+    """Serializes the endpoint projections of one cached club to JSON bytes."""
+    teams = [
+        team.model_dump(mode="json", exclude={"table", "prev_games", "next_games"})
+        for team in cached.teams
+    ]
+    next_games = [game.model_dump(mode="json") for game in cached.club_next_games]
+    prev_games = [game.model_dump(mode="json") for game in cached.club_prev_games]
+    return {
+        "full": orjson.dumps(cached.model_dump(mode="json")),
+        "teams": orjson.dumps(teams),
+        "info": orjson.dumps(
+            {"teams": teams, "prev_games": prev_games, "next_games": next_games}
+        ),
+        "next_games": orjson.dumps(next_games),
+        "prev_games": orjson.dumps(prev_games),
+    }
+
+
+def rebuild_indices() -> None:
+    """Rebuilds the lookup indices and pre-serialized JSON payloads from
+    club_info_cache in one pass."""
+    game_index.clear()
+    team_index.clear()
+    club_info_json_cache.clear()
+    club_info_gzip_cache.clear()
+    club_info_etag_cache.clear()
+    for club_id, cached in club_info_cache.items():
+        blobs = _build_club_json(cached)
+        club_info_json_cache[club_id] = blobs
+        club_info_gzip_cache[club_id] = {
+            key: gzip.compress(payload, 5)
+            for key, payload in blobs.items()
+            if len(payload) >= _GZIP_MIN_SIZE
+        }
+        club_info_etag_cache[club_id] = {
+            key: '"%s"' % hashlib.blake2b(payload, digest_size=8).hexdigest()
+            for key, payload in blobs.items()
+        }
+        for game in cached.club_next_games:
+            if game.id:
+                game_index[game.id] = game
+        for game in cached.club_prev_games:
+            if game.id:
+                game_index[game.id] = game
+        for team in cached.teams:
+            team_index[team.id] = team
+            for game in team.next_games:
+                if game.id:
+                    game_index[game.id] = game
+            for game in team.prev_games:
+                if game.id:
+                    game_index[game.id] = game
+
 CACHE_DIR: Path = settings.CACHE_DIR
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 CACHE_DUMP_FILE = CACHE_DIR / "fussball_cache.json"
 
+# Single SQLite database holding the HTTP cache metadata. One table replaces
+# the former one-JSON-file-per-URL layout: writes are a prepared upsert and
+# the cold-start load is a single SELECT instead of N file reads. WAL mode
+# avoids an fsync per row.
+_META_DB = sqlite3.connect(
+    CACHE_DIR / "cache.db", isolation_level=None, check_same_thread=False
+)
+_META_DB.execute("PRAGMA journal_mode=WAL")
+_META_DB.execute("PRAGMA synchronous=NORMAL")
+_META_DB.execute(
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        hash TEXT PRIMARY KEY,
+        url TEXT,
+        final_url TEXT,
+        status_code INTEGER,
+        headers_json TEXT,
+        etag TEXT,
+        last_modified TEXT,
+        expires_at TEXT,
+        content_file TEXT
+    )
+    """
+)
+
+
+# Only headers that matter after the fetch (validators, freshness, type) are
+# worth keeping per entry; the rest (Server, Via, CDN tracing, ...) is dead
+# weight repeated across a thousand entries.
+_KEEP_HEADERS = frozenset(
+    (
+        "content-type",
+        "etag",
+        "last-modified",
+        "cache-control",
+        "expires",
+        "content-encoding",
+    )
+)
+
+
+def _slim_headers(headers) -> Dict[str, str]:
+    """Filters headers down to _KEEP_HEADERS, interning the keys so all
+    entries share the same key strings."""
+    return {
+        sys.intern(k.lower()): v
+        for k, v in headers.items()
+        if k.lower() in _KEEP_HEADERS
+    }
+
 
 def _url_hash(url: str) -> str:
-    return hashlib.md5(url.encode("utf-8")).hexdigest()
+    # Cache filenames need a fast, collision-resistant digest, not a
+    # cryptographic one; xxh3-128 is an order of magnitude faster than MD5.
+    return xxhash.xxh3_128_hexdigest(url.encode("utf-8"))
+
+
+def _store_metadata(hash_value: str, metadata: Dict[str, Any]) -> None:
+    _META_DB.execute(
+        "INSERT OR REPLACE INTO entries "
+        "(hash, url, final_url, status_code, headers_json, etag, last_modified, "
+        "expires_at, content_file) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            hash_value,
+            metadata["url"],
+            metadata["final_url"],
+            metadata["status_code"],
+            orjson.dumps(metadata["headers"]).decode(),
+            metadata["etag"],
+            metadata["last_modified"],
+            metadata["expires_at"],
+            metadata["content_file"],
+        ),
+    )
 
 
-def fetch_url(
+def _load_all_metadata() -> Dict[str, Dict[str, Any]]:
+    """Loads all persisted cache metadata in one query, keyed by URL hash."""
+    rows = _META_DB.execute(
+        "SELECT hash, url, final_url, status_code, headers_json, etag, "
+        "last_modified, expires_at, content_file FROM entries"
+    ).fetchall()
+    return {
+        row[0]: {
+            "url": row[1],
+            "final_url": row[2],
+            "status_code": row[3],
+            "headers": orjson.loads(row[4]) if row[4] else {},
+            "etag": row[5],
+            "last_modified": row[6],
+            "expires_at": row[7],
+            "content_file": row[8],
+        }
+        for row in rows
+    }
+
+
+async def fetch_url(
     url: str,
     method: str = "GET",
     etag: Optional[str] = None,
@@ -89,11 +366,23 @@ def fetch_url(
     Transparent cache-enabled HTTP fetch.
     Returns cached or live response as a FetchedResponse.
     """
-    entry: Optional[HttpCacheEntry] = http_cache.get(url)
-    now = datetime.now(timezone.utc)
+    tier = _cache_for(url)
+    entry: Optional[HttpCacheEntry] = tier.get(url)
+    now = time.time()
+
+    negative = negative_cache.get(url)
+    if negative and negative.expires_at and negative.expires_at > now:
+        logger.debug("NEGATIVE CACHE HIT: %s", url)
+        return FetchedResponse(
+            url=negative.final_url,
+            status_code=negative.status_code,
+            headers=negative.headers,
+            content=b"",
+            text=None,
+        )
 
     if entry and entry.expires_at and entry.expires_at > now:
-        logger.debug(f"CACHE HIT: {url}")
+        logger.debug("CACHE HIT: %s", url)
         return FetchedResponse(
             url=entry.final_url,
             status_code=entry.status_code,
@@ -102,114 +391,122 @@ def fetch_url(
             text=entry.load_text(),
         )
 
+    # A conditional GET with If-None-Match / If-Modified-Since revalidates an
+    # expired entry in a single round trip: the server answers 304 with an
+    # empty body when the resource is unchanged.
     headers = {}
     if entry and entry.etag:
         headers["If-None-Match"] = entry.etag
     if entry and entry.last_modified:
         headers["If-Modified-Since"] = entry.last_modified
 
-    # If cache entry exists but expired, try a HEAD request first
-    if entry and entry.expires_at and entry.expires_at <= now:
-        try:
-            with httpx.Client(follow_redirects=True) as client:
-                head_resp = client.head(url, headers={})
-            if head_resp.status_code == 200:
-                new_etag = head_resp.headers.get("ETag")
-                new_last_mod = head_resp.headers.get("Last-Modified")
-                if (new_etag and new_etag == entry.etag) or (
-                    new_last_mod and new_last_mod == entry.last_modified
-                ):
-                    logger.debug(f"HEAD check: no change for {url}, extending TTL")
-                    entry.expires_at = now + timedelta(seconds=ttl)
-                    http_cache[url] = entry
-                    return FetchedResponse(
-                        url=entry.final_url,
-                        status_code=entry.status_code,
-                        headers=entry.headers,
-                        content=entry.load_content() or b"",
-                        text=entry.load_text(),
-                    )
-                else:
-                    logger.debug(f"HEAD check: resource changed for {url}, will refetch.")
-        except httpx.RequestError as e:
-            logger.warning(f"HEAD request failed for {url}: {e}")
-
     try:
-        with httpx.Client(follow_redirects=True) as client:
-            resp = client.request(method, url, headers=headers)
+        # The semaphore bounds live upstream requests; cache hits above never
+        # touch it, so warm traffic is unaffected.
+        async with _FETCH_SEM, _ASYNC_CLIENT.stream(method, url, headers=headers) as resp:
+            if resp.status_code == 304 and entry:
+                entry.expires_at = now + ttl
+                tier[url] = entry
+                return FetchedResponse(
+                    url=entry.final_url,
+                    status_code=entry.status_code,
+                    headers=entry.headers,
+                    content=entry.load_content() or b"",
+                    text=entry.load_text(),
+                )
+
+            if resp.status_code >= 400:
+                logger.warning("Caching negative response %s for %s", resp.status_code, url)
+
+                failures = (negative.failure_count if negative else 0) + 1
+                negative_entry = HttpCacheEntry(
+                    url=url,
+                    final_url=str(resp.url),
+                    status_code=resp.status_code,
+                    headers=_slim_headers(resp.headers),
+                    content=None,
+                    text=None,
+                    etag=None,
+                    last_modified=None,
+                    expires_at=now + min(300, 5 * 3 ** (failures - 1)),
+                    failure_count=failures,
+                )
+                negative_cache[url] = negative_entry
+
+                return FetchedResponse(
+                    url=str(resp.url),
+                    status_code=resp.status_code,
+                    headers=dict(resp.headers),
+                    content=b"",
+                    text=None,
+                )
+
+            # Stream the body to disk while it is still downloading, so the
+            # response is never double-buffered inside httpx and the disk
+            # write overlaps the network receive. The joined bytes are kept
+            # because every caller parses the full document anyway.
+            hash_value = _url_hash(url)
+            content_file = CACHE_DIR / f"{hash_value}.bin"
+            chunks = []
+            compressor = _ZSTD_COMP.compressobj()
+            # The temp name must be unique per writer: concurrent fetches of
+            # the same URL would otherwise interleave two zstd streams into
+            # one file and publish the corrupt result via os.replace.
+            with tempfile.NamedTemporaryFile(
+                dir=CACHE_DIR, suffix=".bin.tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                try:
+                    async for chunk in resp.aiter_bytes(65536):
+                        f.write(compressor.compress(chunk))
+                        chunks.append(chunk)
+                    f.write(compressor.flush())
+                except BaseException:
+                    # The rename below never ran: drop the partial temp file
+                    # so aborted downloads don't accumulate in CACHE_DIR.
+                    f.close()
+                    os.unlink(tmp_name)
+                    raise
+            os.replace(tmp_name, content_file)
+            content_bytes = b"".join(chunks)
     except httpx.RequestError as e:
-        logger.error(f"HTTP request failed: {e}")
+        logger.error("HTTP request failed: %s", e)
         return None
 
-    if resp.status_code == 304 and entry:
-        entry.expires_at = now + timedelta(seconds=ttl)
-        http_cache[url] = entry
-        return FetchedResponse(
-            url=entry.final_url,
-            status_code=entry.status_code,
-            headers=entry.headers,
-            content=entry.load_content() or b"",
-            text=entry.load_text(),
-        )
-
-    if resp.status_code >= 400:
-        logger.warning(f"Caching negative response {resp.status_code} for {url}")
-
-        # Store negative entry with short TTL (max 5 minutes)
-        negative_entry = HttpCacheEntry(
-            url=url,
-            final_url=str(resp.url),
-            status_code=resp.status_code,
-            headers=dict(resp.headers),
-            content=None,
-            text=None,
-            etag=None,
-            last_modified=None,
-            expires_at=now + timedelta(seconds=min(300, ttl)),
-        )
-        http_cache[url] = negative_entry
-
-        return FetchedResponse(
-            url=str(resp.url),
-            status_code=resp.status_code,
-            headers=dict(resp.headers),
-            content=b"",
-            text=None,
-        )
-
-    content_bytes = resp.read()
-    text_str = resp.text
+    try:
+        text_str = content_bytes.decode(resp.encoding or "utf-8")
+    except (UnicodeDecodeError, LookupError):
+        text_str = content_bytes.decode("utf-8", errors="replace")
 
-    hash_value = _url_hash(url)
-    content_file = CACHE_DIR / f"{hash_value}.bin"
-    content_file.write_bytes(content_bytes)
+    _content_cache[str(content_file)] = content_bytes
 
     metadata = {
         "url": url,
         "final_url": str(resp.url),
         "status_code": resp.status_code,
-        "headers": dict(resp.headers),
+        "headers": _slim_headers(resp.headers),
         "etag": resp.headers.get("ETag"),
         "last_modified": resp.headers.get("Last-Modified"),
-        "expires_at": (now + timedelta(seconds=ttl)).isoformat(),
+        "expires_at": now + ttl,
         "content_file": str(content_file),
     }
-    meta_file = CACHE_DIR / f"{hash_value}_metadata.json"
-    meta_file.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    await asyncio.to_thread(_store_metadata, hash_value, metadata)
 
     new_entry = HttpCacheEntry(
         url=url,
         final_url=str(resp.url),
         status_code=resp.status_code,
-        headers=dict(resp.headers),
+        headers=_slim_headers(resp.headers),
         content=None,
         text=None,
         etag=resp.headers.get("ETag"),
         last_modified=resp.headers.get("Last-Modified"),
-        expires_at=now + timedelta(seconds=ttl),
+        expires_at=now + ttl,
         content_file=str(content_file),
+        _cached_text=text_str,
     )
-    http_cache[url] = new_entry
+    tier[url] = new_entry
+    negative_cache.pop(url, None)
 
     return FetchedResponse(
         url=str(resp.url),
@@ -220,14 +517,35 @@ def fetch_url(
     )
 
 
+# Timestamp of the last fsync of the cache dump, used to coalesce durability
+# barriers in "interval" fsync mode.
+_last_dump_fsync: float = 0.0
+
+
+def _should_fsync_dump() -> bool:
+    global _last_dump_fsync
+    mode = _CACHE_FSYNC_MODE
+    if mode == "always":
+        return True
+    if mode == "never":
+        return False
+    # "interval": at most one fsync per half prewarm interval
+    now = time.monotonic()
+    if now - _last_dump_fsync >= _PREWARM_INTERVAL_SECONDS / 2:
+        _last_dump_fsync = now
+        return True
+    return False
+
+
 def save_caches_to_file():
     """
     Saves redirects and club_info_cache metadata as JSON in CACHE_DUMP_FILE.
-    Uses flush + fsync to ensure data is written fully to disk.
+    Flushes on every save; fsync is governed by CACHE_FSYNC_MODE so frequent
+    saves don't each pay a full durability barrier.
     """
     try:
         # Only persist the prewarmed club (if configured), to avoid storing arbitrary clubs
-        target_id = settings.PREWARM_CLUB_ID
+        target_id = _PREWARM_CLUB_ID
         if target_id:
             filtered_cache = {
                 target_id: model.model_dump()
@@ -237,23 +555,42 @@ def save_caches_to_file():
         else:
             filtered_cache = {}
 
+        # Derived font mappings are tiny and font names are stable, so
+        # persisting them lets the next boot skip the font downloads.
+        font_mappings = {
+            key[len("font:"):]: entry.content
+            for key, entry in http_cache.items()
+            if isinstance(key, str) and key.startswith("font:") and entry.content
+        }
+
         data = {
-            "redirects": {url: entry.final_url for url, entry in http_cache.items()},
+            "redirects": {
+                url: entry.final_url
+                for tier in (http_cache, _pinned_cache)
+                for url, entry in tier.items()
+                if not (isinstance(url, str) and url.startswith("font:"))
+            },
             "club_info_cache": filtered_cache,
+            "font_mappings": font_mappings,
         }
-        with open(CACHE_DUMP_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(CACHE_DUMP_FILE, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
             f.flush()
-            os.fsync(f.fileno())
-        logger.info(f"Saved caches to {CACHE_DUMP_FILE}")
+            if _should_fsync_dump():
+                os.fsync(f.fileno())
+        logger.info("Saved caches to %s", CACHE_DUMP_FILE)
     except Exception as e:
-        logger.error(f"Failed to save caches: {e}")
+        logger.error("Failed to save caches: %s", e)
 
 
 def load_caches_from_file():
     """
     Loads redirects and club_info_cache from CACHE_DUMP_FILE if it exists.
-    Entries from metadata.json files are rebuilt into http_cache.
+    Entries from the metadata database are rebuilt into http_cache.
     """
     if not CACHE_DUMP_FILE.exists():
         return
@@ -262,30 +599,46 @@ def load_caches_from_file():
         file_size = CACHE_DUMP_FILE.stat().st_size
         if file_size > 10 * 1024 * 1024:  # 10 MB
             logger.warning(
-                f"Cache file {CACHE_DUMP_FILE} exceeds 10 MB ({file_size} bytes). Deleting..."
+                "Cache file %s exceeds 10 MB (%s bytes). Deleting...",
+                CACHE_DUMP_FILE,
+                file_size,
             )
             CACHE_DUMP_FILE.unlink(missing_ok=True)
             return
 
-        with open(CACHE_DUMP_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(CACHE_DUMP_FILE.read_bytes())
+
+        redirects = data.get("redirects", {})
+        if _PREWARM_CLUB_ID:
+            # Only the prewarmed club is served from a warm start; everything
+            # else lazy-loads on first miss. This keeps cold boot proportional
+            # to the prewarm set instead of every URL ever persisted.
+            redirects = {
+                url: final
+                for url, final in redirects.items()
+                if _PREWARM_CLUB_ID in url
+            }
 
-        for url, final in data.get("redirects", {}).items():
-            hash_value = _url_hash(url)
-            meta_file = CACHE_DIR / f"{hash_value}_metadata.json"
-            if meta_file.exists():
+        all_meta = _load_all_metadata()
+        for url, final in redirects.items():
+            meta = all_meta.get(_url_hash(url))
+            if meta:
                 try:
-                    meta = json.loads(meta_file.read_text(encoding="utf-8"))
-                    expires_at = (
-                        datetime.fromisoformat(meta.get("expires_at"))
-                        if meta.get("expires_at")
-                        else None
-                    )
+                    raw_expires = meta.get("expires_at")
+                    if raw_expires is None:
+                        expires_at = None
+                    else:
+                        try:
+                            expires_at = float(raw_expires)
+                        except (TypeError, ValueError):
+                            # Entries written before the switch to unix
+                            # timestamps stored ISO-8601 strings.
+                            expires_at = datetime.fromisoformat(raw_expires).timestamp()
                     entry = HttpCacheEntry(
                         url=meta["url"],
                         final_url=meta["final_url"],
                         status_code=meta["status_code"],
-                        headers=meta.get("headers", {}),
+                        headers=_slim_headers(meta.get("headers", {})),
                         etag=meta.get("etag"),
                         last_modified=meta.get("last_modified"),
                         expires_at=expires_at,
@@ -293,9 +646,25 @@ def load_caches_from_file():
                         content=None,
                         text=None,
                     )
-                    http_cache[url] = entry
+                    _cache_for(url)[url] = entry
                 except Exception as e:
-                    logger.error(f"Failed to restore cache entry for {url}: {e}")
+                    logger.error("Failed to restore cache entry for %s: %s", url, e)
+
+        for font_name, mapping in data.get("font_mappings", {}).items():
+            try:
+                # JSON keys round-trip as strings; translate tables need ints.
+                table = {int(code): digit for code, digit in mapping.items()}
+            except (TypeError, ValueError):
+                continue
+            http_cache[f"font:{font_name}"] = HttpCacheEntry(
+                url=f"font:{font_name}",
+                final_url=f"font:{font_name}",
+                status_code=200,
+                headers={},
+                content=table,
+                text=None,
+                expires_at=time.time() + settings.CACHE_TTL_FONT,
+            )
 
         from .schemas import FullClubInfoResponse
         loaded: Dict[str, FullClubInfoResponse] = {}
@@ -303,9 +672,9 @@ def load_caches_from_file():
             try:
                 loaded[club_id] = FullClubInfoResponse(**payload)
             except Exception as e:
-                logger.error(f"Failed to restore club_info_cache for {club_id}: {e}")
+                logger.error("Failed to restore club_info_cache for %s: %s", club_id, e)
 
-        target_id = settings.PREWARM_CLUB_ID
+        target_id = _PREWARM_CLUB_ID
         if target_id:
             # Keep only the prewarmed club in RAM
             filtered = {target_id: loaded[target_id]} if target_id in loaded else {}
@@ -320,5 +689,6 @@ def load_caches_from_file():
             # No prewarm configured -> avoid keeping any club cache in RAM
             club_info_cache.clear()
             logger.info("No PREWARM_CLUB_ID set; cleared club_info_cache on load.")
+        rebuild_indices()
     except Exception as e:
-        logger.error(f"Failed to load caches: {e}")
+        logger.error("Failed to load caches: %s", e)
@@ -12,8 +12,10 @@ class Settings(BaseSettings):
     :ivar CACHE_TTL_GAMES: TTL for game-related caches in seconds.
     :ivar CACHE_TTL_TABLE: TTL for table caches in seconds.
     :ivar CACHE_TTL_TEAMS: TTL for club team list caches in seconds.
+    :ivar CACHE_TTL_PREV_GAMES: Refresh interval for already played games.
     :ivar PREWARM_CLUB_ID: If set, proactively caches all data for this club ID.
     :ivar PREWARM_INTERVAL_SECONDS: Interval for the pre-warming job in seconds.
+    :ivar MAX_CONCURRENCY: Maximum number of simultaneous upstream HTTP requests.
     """
 
     model_config = SettingsConfigDict(
@@ -31,6 +33,12 @@ class Settings(BaseSettings):
     CACHE_TTL_TABLE: int = 3600  # 1 hour
     CACHE_TTL_TEAMS: int = 7200  # 2 hours
     CACHE_TTL_FONT: int = 86400  # 24 hours
+    # Finished games only gain data when another matchday completes, so the
+    # prewarmer refreshes them far less often than upcoming games.
+    CACHE_TTL_PREV_GAMES: int = 86400  # 24 hours
+
+    # Upper bound on concurrent requests to fussball.de across all callers.
+    MAX_CONCURRENCY: int = 10
 
     # Proactive Caching (Pre-warming)
     PREWARM_CLUB_ID: Optional[str] = None
@@ -39,5 +47,10 @@ class Settings(BaseSettings):
     # Cache directory (configurable via environment variable)
     CACHE_DIR: Path = Path("./cache_payloads")
 
+    # Durability barrier for cache dumps: "always" fsyncs on every save,
+    # "interval" coalesces fsyncs to at most one per half prewarm interval,
+    # "never" relies on the OS page cache (the data is refetchable anyway).
+    CACHE_FSYNC_MODE: str = "interval"
+
 
 settings = Settings()
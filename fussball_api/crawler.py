@@ -1,13 +1,19 @@
+import ast
 import asyncio
 import logging
 import re
-from datetime import datetime, timedelta, timezone
+import time
+from collections import deque
+from datetime import datetime, timezone
 from io import BytesIO
 from typing import Dict, List, Optional
 from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
+import soupsieve as sv
+import xxhash
 from bs4 import BeautifulSoup
 from fontTools import ttLib
 
@@ -24,6 +30,15 @@ logger = logging.getLogger(__name__)
 
 FUSSBALL_DE_BASE_URL = "https://www.fussball.de"
 
+# Shared timezone objects for the parse loops; ZoneInfo lookups are cached
+# but still cost a cache probe per construction.
+_BERLIN_TZ = ZoneInfo("Europe/Berlin")
+_UTC_TZ = timezone.utc
+
+# Compiled once: normalize_logo_url runs several times per game row, and the
+# precompiled pattern skips the re-cache lookup on every call.
+_LOGO_FORMAT_RE = re.compile(r"format/\d+")
+
 
 def normalize_logo_url(url: str) -> str:
     """
@@ -35,9 +50,21 @@ def normalize_logo_url(url: str) -> str:
     """
     if not url:
         return url
-    return re.sub(r"format/\d+", "format/9", url)
+    return _LOGO_FORMAT_RE.sub("format/9", url)
 
 
+# One pass over a date-separator row ("Sa, 25.05.2024 - 15:30 Uhr | Herren |
+# Kreisliga A"); the trailing segments (age group, competition) are optional.
+_DATE_ROW_RE = re.compile(
+    r"^\w+, (?P<date>\d{2}\.\d{2}\.\d{4}) - (?P<time>\d{2}:\d{2}) Uhr"
+    r"(?: \| (?P<age_group>[^|]+?))?(?: \| (?P<competition>.+))?$"
+)
+
+# Private Use Area glyphs carry the obfuscated digits; stray ones outside a
+# decoded span are noise. One C-level regex pass replaces the per-character
+# range checks.
+_PUA_RE = re.compile(r"[-]")
+
 # Mapping from font names to digit values, used for score deobfuscation.
 _FONT_DIGIT_MAPPING = {
     "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
@@ -46,141 +73,238 @@ _FONT_DIGIT_MAPPING = {
 }
 
 
-async def _get_font_mapping(font_name: str) -> Dict[str, str]:
+# Single-flight maps: concurrent callers for the same font or player profile
+# share one in-flight fetch instead of racing to download it in parallel.
+_font_inflight: Dict[str, "asyncio.Task"] = {}
+_player_inflight: Dict[str, "asyncio.Task"] = {}
+
+# Parsed cmap mappings keyed by a hash of the WOFF bytes; identical bytes
+# served under different font names reuse one fontTools parse.
+_FONT_PARSE_CACHE: Dict[int, Dict[int, str]] = {}
+
+
+async def _get_font_mapping(font_name: str) -> Dict[int, str]:
     """
     Retrieves or creates a deobfuscation mapping for a given font.
 
     Downloads a .woff font file from fussball.de, parses it to extract
-    the character-to-digit mapping, and caches the result.
+    the character-to-digit mapping, and caches the result. Concurrent
+    callers for the same font share a single download.
 
     :param font_name: The name of the font (e.g., 'score-font-12345').
-    :return: A dictionary mapping hex character codes to digit strings.
+    :return: A dictionary mapping int code points to digit strings, directly
+        usable as a str.translate table.
     """
     entry: Optional[HttpCacheEntry] = http_cache.get(f"font:{font_name}")
     if entry:
         expires = getattr(entry, "expires_at", None)
-        if expires is None or expires > datetime.now(timezone.utc):
+        if expires is None or expires > time.time():
             logger.debug("Font mapping cache hit for: %s", font_name)
             return entry.content
         else:
             logger.debug("Font mapping cache expired for: %s", font_name)
 
-    logger.info(f"Font mapping cache miss for: {font_name}. Fetching font.")
+    task = _font_inflight.get(font_name)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_font_mapping(font_name))
+        _font_inflight[font_name] = task
+        task.add_done_callback(lambda _t: _font_inflight.pop(font_name, None))
+    return await task
+
+
+async def _fetch_font_mapping(font_name: str) -> Dict[int, str]:
+    """Downloads and parses one font, writing the mapping to the cache."""
+    logger.info("Font mapping cache miss for: %s. Fetching font.", font_name)
     font_url = f"{FUSSBALL_DE_BASE_URL}/export.fontface/-/format/woff/id/{font_name}/type/font"
 
-    response = await asyncio.to_thread(fetch_url, font_url)
+    response = await fetch_url(font_url)
     if not response or response.status_code != 200:
-        logger.error(f"Failed to download font file: {font_name}")
+        logger.error("Failed to download font file: %s", font_name)
         return {}
 
-    font_data = BytesIO(response.content)
-    try:
-        font = ttLib.TTFont(font_data)
-        cmap = font.getBestCmap()
+    # fussball.de serves identical WOFF bytes under many font names, so the
+    # parsed mapping is keyed by a content hash and reused instead of running
+    # fontTools again for every name.
+    font_key = xxhash.xxh3_64_intdigest(response.content)
+    mapping = _FONT_PARSE_CACHE.get(font_key)
+    if mapping is None:
+        font_data = BytesIO(response.content)
+        try:
+            # lazy=True defers table decompilation, so only the cmap table is
+            # actually parsed; everything else in the WOFF stays untouched.
+            font = ttLib.TTFont(font_data, lazy=True, ignoreDecompileErrors=True)
+            cmap = font.getBestCmap()
+        except ttLib.TTLibError as e:
+            logger.error("Error parsing font file %s: %s", font_name, e)
+            return {}
         if not cmap:
-            logger.error(f"No cmap table found in font: {font_name}")
+            logger.error("No cmap table found in font: %s", font_name)
             return {}
 
+        # Keys are int code points, so the mapping doubles as a
+        # str.translate table and lookups need no per-character hex
+        # formatting or case normalization.
         mapping = {}
         for code, name in cmap.items():
-            hex_code = f"{code:x}"
             digit = _FONT_DIGIT_MAPPING.get(name)
             if digit:
-                mapping[hex_code] = digit
+                mapping[code] = digit
             elif name.lower().startswith("uni"):
-                # Map Private Use Area glyphs like "uniE675" directly by hex code
+                # Map Private Use Area glyphs like "uniE675" directly by code point
                 uni_hex = name[3:]
                 if uni_hex:
-                    mapping[hex_code] = mapping.get(hex_code) or ""
-
-        http_cache[f"font:{font_name}"] = HttpCacheEntry(
-            url=font_url,
-            final_url=font_url,
-            status_code=200,
-            headers={},
-            content=mapping,
-            text=None,
-            expires_at=datetime.now(timezone.utc) + timedelta(seconds=settings.CACHE_TTL_FONT),
-        )
-        logger.info(f"Successfully created and cached font mapping for: {font_name}")
-        return mapping
-    except ttLib.TTLibError as e:
-        logger.error(f"Error parsing font file {font_name}: {e}")
-        return {}
+                    mapping[code] = mapping.get(code) or ""
+        _FONT_PARSE_CACHE[font_key] = mapping
+    else:
+        logger.debug("Font parse cache hit for: %s", font_name)
+
+    http_cache[f"font:{font_name}"] = HttpCacheEntry(
+        url=font_url,
+        final_url=font_url,
+        status_code=200,
+        headers={},
+        content=mapping,
+        text=None,
+        expires_at=time.time() + settings.CACHE_TTL_FONT,
+    )
+    logger.info("Successfully created and cached font mapping for: %s", font_name)
+    return mapping
 
 
 async def _deobfuscate_text(span_tag) -> Optional[str]:
     """
     Deobfuscates obfuscated text using the provided font mapping.
     Works for any <span data-obfuscation="..."> element.
+
+    Accepts either a BeautifulSoup tag or a bare lxml element, so callers
+    iterating many nodes can skip the per-node bs4 wrapper objects.
     """
-    if not span_tag or not span_tag.text:
+    if span_tag is None or not span_tag.text:
         return None
+    # bs4 tags expose get_text(); lxml elements expose text_content().
+    if hasattr(span_tag, "get_text"):
+        plain = span_tag.get_text(strip=True)
+    else:
+        plain = span_tag.text_content().strip()
     font_name = span_tag.get("data-obfuscation")
     if not font_name:
-        return span_tag.get_text(strip=True)
+        return plain
 
     mapping = await _get_font_mapping(font_name)
     if not mapping:
-        return span_tag.get_text(strip=True)
+        return plain
 
     decoded_chars = []
     for ch in span_tag.text.strip():
-        hex_code = f"{ord(ch):x}"
-        digit = mapping.get(hex_code) or mapping.get(hex_code.upper())
+        digit = mapping.get(ord(ch))
         if digit:
             decoded_chars.append(digit)
 
     return "".join(decoded_chars)
 
 
-async def _deobfuscate_all(parent_tag) -> str:
+async def _prefetch_font_mappings(parent_tag) -> Dict[str, Dict[int, str]]:
+    """
+    Fetches all unique font mappings referenced below a tag, concurrently.
+
+    Called once per page so that the per-row deobfuscation passes become pure
+    dictionary lookups instead of each triggering its own font download.
+
+    :param parent_tag: The BeautifulSoup tag (or soup) to scan.
+    :return: A mapping of font name to its deobfuscation mapping.
+    """
+    font_names = [
+        name
+        for name in {
+            s.get("data-obfuscation")
+            for s in parent_tag.select("span[data-obfuscation]")
+        }
+        if name
+    ]
+    results = await asyncio.gather(
+        *(_get_font_mapping(name) for name in font_names), return_exceptions=True
+    )
+    font_mappings: Dict[str, Dict[int, str]] = {}
+    for font_name, mapping in zip(font_names, results):
+        if isinstance(mapping, BaseException):
+            logger.warning("Failed to get font mapping for '%s': %s", font_name, mapping)
+            font_mappings[font_name] = {}
+        else:
+            font_mappings[font_name] = mapping
+    return font_mappings
+
+
+# Documents below this size parse faster inline than the thread hand-off
+# costs; only the big list/details pages are worth offloading.
+_PARSE_OFFLOAD_THRESHOLD = 32 * 1024
+
+
+async def _parse_html(html: str) -> BeautifulSoup:
+    """
+    Parses HTML into a BeautifulSoup tree without stalling the event loop.
+
+    Large documents are handed to a worker thread so concurrent fetches keep
+    making progress while lxml chews through the markup; small ones are
+    parsed inline because the thread hop would dominate.
+
+    :param html: The raw HTML document.
+    :return: The parsed BeautifulSoup tree.
+    """
+    if len(html) < _PARSE_OFFLOAD_THRESHOLD:
+        return BeautifulSoup(html, "lxml")
+    return await asyncio.to_thread(BeautifulSoup, html, "lxml")
+
+
+async def _deobfuscate_all(
+    parent_tag, font_mappings: Optional[Dict[str, Dict[int, str]]] = None
+) -> str:
     """
     Deobfuscates all <span data-obfuscation="..."> tags inside a parent BeautifulSoup tag.
     Fetches each unique font mapping at most once and concatenates decoded and raw texts
     in document order, skipping Private Use Area glyphs.
+
+    :param font_mappings: Pre-fetched mappings from _prefetch_font_mappings;
+        when omitted, the mappings for this subtree are fetched here.
     """
     if not parent_tag:
         return ""
 
-    spans = parent_tag.find_all("span", attrs={"data-obfuscation": True})
-    font_names = {s.get("data-obfuscation") for s in spans if s.get("data-obfuscation")}
-    font_mappings: Dict[str, Dict[str, str]] = {}
+    # Most cells carry no obfuscated spans at all; one selector probe (which
+    # stops at the first match) is far cheaper than the full walk below.
+    if not parent_tag.select_one("span[data-obfuscation]"):
+        return parent_tag.get_text(strip=True)
 
-    for font_name in font_names:
-        try:
-            font_mappings[font_name] = await _get_font_mapping(font_name)
-        except Exception as exc:
-            logger.warning("Failed to get font mapping for '%s': %s", font_name, exc)
-            font_mappings[font_name] = {}
+    if font_mappings is None:
+        font_mappings = await _prefetch_font_mappings(parent_tag)
 
     parts: List[str] = []
-    stack = [parent_tag]
+    # deque: list.pop(0) and front-inserts shift the whole buffer, turning the
+    # walk quadratic on big subtrees.
+    stack = deque([parent_tag])
 
     from bs4 import NavigableString, Tag  # local import to avoid global dependency in signatures
 
     while stack:
-        node = stack.pop(0)
+        node = stack.popleft()
 
         if isinstance(node, Tag):
             if node.name == "span" and node.has_attr("data-obfuscation"):
                 font_name = node["data-obfuscation"]
-                mapping = font_mappings.get(font_name, {})
+                mapping = font_mappings.get(font_name)
                 text = node.get_text() or ""
-                decoded = []
-                for ch in text:
-                    key = f"{ord(ch):x}"
-                    decoded.append(mapping.get(key, ch))
-                parts.append("".join(decoded))
+                if mapping:
+                    # The int-keyed mapping is a ready-made translate table.
+                    text = text.translate(mapping)
+                parts.append(text)
                 # do not enqueue children to avoid double-adding raw obfuscated text
                 continue
             # enqueue children in order
-            stack[0:0] = list(node.children)
+            stack.extendleft(reversed(list(node.children)))
         elif isinstance(node, NavigableString):
             txt = str(node)
             if txt:
-                stripped = txt.strip()
-                if stripped and not all("\uE000" <= c <= "\uF8FF" for c in stripped):
+                stripped = _PUA_RE.sub("", txt.strip())
+                if stripped:
                     parts.append(stripped)
 
     return "".join(parts).strip()
@@ -195,90 +319,95 @@ async def _get_games(url: str, cache_key: str) -> List[Game]:
     :param cache_key: The key to use for caching.
     :return: A list of Game objects.
     """
-    logger.debug(f"Attempting to get games for cache_key: {cache_key}")
+    logger.debug("Attempting to get games for cache_key: %s", cache_key)
 
-    logger.info(f"Fetching games from URL: {url}")
-    response = await asyncio.to_thread(fetch_url, url)
+    logger.info("Fetching games from URL: %s", url)
+    response = await fetch_url(url)
 
     if response is None:
-        logger.warning(f"Request failed for {url}. Cannot fetch games for {cache_key}.")
+        logger.warning("Request failed for %s. Cannot fetch games for %s.", url, cache_key)
         return []
 
     html_content = response.text or ""
     if not html_content.strip():
-        logger.info(f"No game content available for URL: {url}")
+        logger.info("No game content available for URL: %s", url)
         return []
 
-    logger.debug(f"Parsing new HTML content for games: {cache_key}")
-    soup = BeautifulSoup(html_content, "lxml")
-    game_rows = soup.find_all("tr")
-
-    games = []
+    logger.debug("Parsing new HTML content for games: %s", cache_key)
+    soup = await _parse_html(html_content)
+    # Select only the rows the loop below can use (date separators and rows
+    # with a score cell) instead of sweeping every <tr> and filtering in
+    # Python; the selector walk happens inside lxml.
+    game_rows = soup.select("table tr.visible-small, table tr:has(td.column-score)")
+
+    # Warm every font mapping used on the page in one concurrent fan-out, so
+    # per-row deobfuscation never blocks on a font download.
+    font_mappings = await _prefetch_font_mappings(soup)
+
+    # Pass 1: parse every row synchronously, collecting the per-game facts
+    # that need no further I/O. The actual detail/match-course fetches happen
+    # in a bounded concurrent pass afterwards, so a page with N games costs
+    # roughly one round trip instead of N sequential ones.
+    parsed_games = []
     current_date_info = {}
 
     for row in game_rows:
-        if "visible-small" in row.get("class", []):
-            info_cell = row.find("td")
+        if "visible-small" in (row.get("class") or ()):
+            info_cell = row.select_one("td")
             if not info_cell:
                 continue
 
             info_text = info_cell.get_text(strip=True)
-            try:
-                date_time_info = info_text.split(" - ")
-                date_str = date_time_info[0]
-                date = date_str.split(", ")[1]
-
-                other_info_part = " - ".join(date_time_info[1:])
-                other_info = other_info_part.split(" | ")
-                time_str = other_info[0].replace(" Uhr", "").strip()
-
-                game_datetime_utc = None
-                try:
-                    # fussball.de provides naive datetimes, we assume they are in local German time
-                    local_tz = ZoneInfo("Europe/Berlin")
-                    naive_dt = datetime.strptime(f"{date} {time_str}", "%d.%m.%Y %H:%M")
-                    local_dt = naive_dt.replace(tzinfo=local_tz)
-                    utc_dt = local_dt.astimezone(ZoneInfo("UTC"))
-                    game_datetime_utc = utc_dt
-                except ValueError:
-                    logger.warning(f"Could not parse datetime: '{date} {time_str}'.")
-                    current_date_info = {}
-                    continue
+            match = _DATE_ROW_RE.match(info_text)
+            if not match:
+                logger.warning("Could not parse date/time/comp row: '%s'.", info_text)
+                current_date_info = {}
+                continue
 
-                age_group = None
-                competition = None
-                if len(other_info) == 3:
-                    age_group = other_info[1].strip()
-                    competition = other_info[2].strip()
-                elif len(other_info) == 2:
-                    competition = other_info[1].strip()
-
-                current_date_info = {
-                    "datetime_utc": game_datetime_utc,
-                    "competition": competition,
-                    "age_group": age_group,
-                }
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Could not parse date/time/comp row: '{info_text}'. Error: {e}")
+            try:
+                # fussball.de provides naive datetimes, we assume they are in
+                # local German time. Direct construction from the captured
+                # fields avoids strptime's format re-parse per row.
+                day, month, year = match.group("date").split(".")
+                hour, minute = match.group("time").split(":")
+                local_dt = datetime(
+                    int(year), int(month), int(day), int(hour), int(minute),
+                    tzinfo=_BERLIN_TZ,
+                )
+            except ValueError:
+                logger.warning("Could not parse datetime row: '%s'.", info_text)
                 current_date_info = {}
+                continue
+
+            age_group = match.group("age_group")
+            competition = match.group("competition")
+            # A single trailing segment is the competition, not the age group.
+            if competition is None and age_group is not None:
+                competition, age_group = age_group, None
+
+            current_date_info = {
+                "datetime_utc": local_dt.astimezone(_UTC_TZ),
+                "competition": competition.strip() if competition else None,
+                "age_group": age_group.strip() if age_group else None,
+            }
             continue
 
-        score_cell = row.find("td", class_="column-score")
+        score_cell = row.select_one("td.column-score")
         if not score_cell or not current_date_info:
             continue
 
         try:
-            home_team_cell = row.find("td", class_="column-club-left")
-            away_team_cell = row.find("td", class_="column-club-right")
+            home_team_cell = row.select_one("td.column-club-left")
+            away_team_cell = row.select_one("td.column-club-right")
 
             # Fallback for different HTML structure (e.g., in past games)
             if not home_team_cell or not away_team_cell:
-                club_cells = row.find_all("td", class_="column-club")
+                club_cells = row.select("td.column-club")
                 if len(club_cells) == 2:
                     home_team_cell = club_cells[0]
                     away_team_cell = club_cells[1]
                 else:
-                    logger.warning(f"Could not find home/away team cells. Skipping. Row: {row}")
+                    logger.warning("Could not find home/away team cells. Skipping. Row: %s", row)
                     continue
 
             home_team_name = home_team_cell.find(class_="club-name").get_text(strip=True)
@@ -295,97 +424,163 @@ async def _get_games(url: str, cache_key: str) -> List[Game]:
                 away_team_logo = f"https:{away_team_logo}"
             away_team_logo = normalize_logo_url(away_team_logo)
 
-            location = None
-            location_url = None
             game_details_url = None
             game_id: Optional[str] = None
-            game_details_link_tag = score_cell.find("a")
+            game_details_link_tag = score_cell.select_one("a")
             if game_details_link_tag and game_details_link_tag.has_attr("href"):
                 game_details_url = f"{game_details_link_tag['href']}"
                 try:
                     game_id = game_details_url.strip("/").split("/")[-1]
                 except Exception:
                     game_id = None
-                logger.debug(f"Fetching game details from: {game_details_url}")
-
-                details_response = await asyncio.to_thread(fetch_url, game_details_url)
-                if details_response and details_response.status_code == 200:
-                    details_soup = BeautifulSoup(details_response.text, "lxml")
-                    stage_section = details_soup.find("section", id="stage")
-                    if stage_section:
-                        location_link = stage_section.find("a", class_="location")
-                        if location_link:
-                            location = location_link.get_text(strip=True)
-                            if location_link.has_attr("href"):
-                                location_url = location_link["href"]
-                            location = location.replace("Rasenplatz, ", "")
-                            logger.debug(f"Found location: {location}")
-
-                        # Extract match events JSON if available
-                        events_container = details_soup.find("div", id="rangescontainer")
-                        match_events = None
-                        if events_container and events_container.has_attr("data-match-events"):
-                            raw_events = events_container["data-match-events"]
-                            try:
-                                import json
-                                events_json = json.loads(raw_events.replace("'", '"'))
-                                match_events = events_json
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to parse match events JSON for {game_details_url}: {e}"
-                                )
-                elif details_response:
-                    logger.warning(
-                        f"Failed to fetch game details from {game_details_url}, "
-                        f"status: {details_response.status_code}"
-                    )
-                else:
-                    logger.warning(f"Request for game details failed for URL: {game_details_url}")
 
-            status_tag = score_cell.find("span", class_="info-text")
+            status_tag = score_cell.select_one("span.info-text")
             status = status_tag.get_text(strip=True) if status_tag else None
 
-            # Deobfuscate scores for past games
-            home_score = None
-            away_score = None
-
-            decoded_score = await _deobfuscate_all(score_cell)
-            if ":" in decoded_score:
-                parts = decoded_score.split(":", 1)
-                home_score, away_score = parts[0].strip() or None, parts[1].strip() or None
-
-            match_events: List[MatchEvent] = []
-            if game_id:
-                try:
-                    match_events = await _get_match_course(game_id)
-                except Exception as e:
-                    logger.warning(f"Could not fetch match course for {game_details_url}: {e}")
-
-            # Ensure we always have a game ID; fall back to a deterministic composite ID
-            fallback_id = game_id or f"{current_date_info.get('datetime_utc')}_{home_team_name}_vs_{away_team_name}"
-            game = Game(
-                id=fallback_id,
-                **current_date_info,
-                home_team=home_team_name,
-                home_logo=home_team_logo,
-                away_team=away_team_name,
-                away_logo=away_team_logo,
-                status=status,
-                home_score=home_score,
-                away_score=away_score,
-                location=location,
-                location_url=location_url,
-                match_events=match_events,
+            parsed_games.append(
+                {
+                    "date_info": dict(current_date_info),
+                    "home_team": home_team_name,
+                    "home_logo": home_team_logo,
+                    "away_team": away_team_name,
+                    "away_logo": away_team_logo,
+                    "score_cell": score_cell,
+                    "game_details_url": game_details_url,
+                    "game_id": game_id,
+                    "status": status,
+                }
             )
-            games.append(game)
         except (AttributeError, TypeError) as e:
-            logger.error(f"Error parsing game row for {cache_key}: {e}. Row content: {row}")
+            logger.error("Error parsing game row for %s: %s. Row content: %s", cache_key, e, row)
             continue
 
-    logger.info(f"Parsed {len(games)} games for {cache_key}")
+    # Pass 2: fetch details and match courses for all rows concurrently,
+    # bounded so one page cannot open more than 10 sockets at once.
+    sem = asyncio.Semaphore(10)
+    results = await asyncio.gather(
+        *(_build_game(sem, parsed, font_mappings) for parsed in parsed_games),
+        return_exceptions=True,
+    )
+
+    games = []
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error("Error building game for %s: %s", cache_key, result)
+        elif result is not None:
+            games.append(result)
+
+    logger.info("Parsed %s games for %s", len(games), cache_key)
     return games
 
 
+async def _build_game(
+    sem: asyncio.Semaphore,
+    parsed: Dict,
+    font_mappings: Optional[Dict[str, Dict[int, str]]] = None,
+) -> Optional[Game]:
+    """
+    Completes one pre-parsed game row: fetches the details page and match
+    course, deobfuscates the score, and assembles the Game object.
+
+    :param sem: Semaphore bounding concurrent fetches for the page.
+    :param parsed: Row facts collected by the synchronous parse pass.
+    :param font_mappings: Pre-fetched font mappings for the page.
+    :return: The assembled Game object.
+    """
+    async with sem:
+        game_details_url = parsed["game_details_url"]
+        game_id = parsed["game_id"]
+        location = None
+        location_url = None
+        course_events: Optional[List[MatchEvent]] = None
+
+        if game_details_url:
+            logger.debug("Fetching game details from: %s", game_details_url)
+            details_response = await fetch_url(game_details_url)
+            if details_response and details_response.status_code == 200:
+                details_soup = await _parse_html(details_response.text)
+                stage_section = details_soup.find("section", id="stage")
+                if stage_section:
+                    location_link = stage_section.find("a", class_="location")
+                    if location_link:
+                        location = location_link.get_text(strip=True)
+                        if location_link.has_attr("href"):
+                            location_url = location_link["href"]
+                        location = location.replace("Rasenplatz, ", "")
+                        logger.debug("Found location: %s", location)
+
+                    # Validate match events JSON if available
+                    events_container = details_soup.find("div", id="rangescontainer")
+                    if events_container and events_container.has_attr("data-match-events"):
+                        raw_events = events_container["data-match-events"]
+                        try:
+                            orjson.loads(raw_events)
+                        except orjson.JSONDecodeError:
+                            # The attribute sometimes holds a Python-literal
+                            # dict with single quotes; literal_eval parses it
+                            # without corrupting apostrophes in values.
+                            try:
+                                ast.literal_eval(raw_events)
+                            except (ValueError, SyntaxError) as e:
+                                logger.warning(
+                                    "Failed to parse match events JSON for %s: %s",
+                                    game_details_url,
+                                    e,
+                                )
+
+                # Some details pages embed the match course directly; parse it
+                # from the tree we already have instead of hitting the AJAX
+                # endpoint again below.
+                if details_soup.select_one("#match_course_body"):
+                    course_events = await _parse_match_course(details_soup)
+            elif details_response:
+                logger.warning(
+                    "Failed to fetch game details from %s, status: %s",
+                    game_details_url,
+                    details_response.status_code,
+                )
+            else:
+                logger.warning("Request for game details failed for URL: %s", game_details_url)
+
+        # Deobfuscate scores for past games
+        home_score = None
+        away_score = None
+
+        decoded_score = await _deobfuscate_all(parsed["score_cell"], font_mappings)
+        if ":" in decoded_score:
+            parts = decoded_score.split(":", 1)
+            home_score, away_score = parts[0].strip() or None, parts[1].strip() or None
+
+        match_events: List[MatchEvent] = []
+        if course_events is not None:
+            match_events = course_events
+        elif game_id:
+            try:
+                match_events = await _get_match_course(game_id)
+            except Exception as e:
+                logger.warning("Could not fetch match course for %s: %s", game_details_url, e)
+
+        # Ensure we always have a game ID; fall back to a deterministic composite ID
+        fallback_id = (
+            game_id
+            or f"{parsed['date_info'].get('datetime_utc')}_{parsed['home_team']}_vs_{parsed['away_team']}"
+        )
+        return Game(
+            id=fallback_id,
+            **parsed["date_info"],
+            home_team=parsed["home_team"],
+            home_logo=parsed["home_logo"],
+            away_team=parsed["away_team"],
+            away_logo=parsed["away_logo"],
+            status=parsed["status"],
+            home_score=home_score,
+            away_score=away_score,
+            location=location,
+            location_url=location_url,
+            match_events=match_events,
+        )
+
+
 async def get_club_next_games(club_id: str) -> List[Game]:
     """
     Crawls and parses the next games for a given club ID.
@@ -442,18 +637,18 @@ async def get_club_teams(club_id: str) -> List[Team]:
     :param club_id: The ID of the club.
     :return: A list of Team objects.
     """
-    logger.debug(f"Attempting to get teams for club_id: {club_id}")
+    logger.debug("Attempting to get teams for club_id: %s", club_id)
     url = f"{FUSSBALL_DE_BASE_URL}/ajax.club.teams/-/action/search/id/{club_id}"
-    response = await asyncio.to_thread(fetch_url, url)
+    response = await fetch_url(url)
 
     if response is None:  # Error during request
-        logger.warning(f"Request failed for {url}. Cannot fetch teams for {club_id}.")
+        logger.warning("Request failed for %s. Cannot fetch teams for %s.", url, club_id)
         return []
 
     # New data received, parse it
-    logger.debug(f"Parsing new HTML content for club_id: {club_id}")
+    logger.debug("Parsing new HTML content for club_id: %s", club_id)
     html_content = response.text or ""
-    soup = BeautifulSoup(html_content, "lxml")
+    soup = await _parse_html(html_content)
     teams = []
     team_items = soup.find_all("div", class_="item")
 
@@ -477,7 +672,7 @@ async def get_club_teams(club_id: str) -> List[Team]:
             )
         )
 
-    logger.info(f"Parsed {len(teams)} teams for club {club_id}")
+    logger.info("Parsed %s teams for club %s", len(teams), club_id)
     return teams
 
 
@@ -489,33 +684,32 @@ async def get_team_table(team_id: str) -> Optional[Table]:
     :param team_id: The ID of the team.
     :return: A Table object, or None if no table is available.
     """
-    logger.debug(f"Attempting to get table for team_id: {team_id}")
+    logger.debug("Attempting to get table for team_id: %s", team_id)
     url = f"{FUSSBALL_DE_BASE_URL}/ajax.team.table/-/team-id/{team_id}"
-    response = await asyncio.to_thread(fetch_url, url)
+    response = await fetch_url(url)
 
     if response is None:
-        logger.warning(f"Request failed for {url}. Cannot fetch table for {team_id}.")
+        logger.warning("Request failed for %s. Cannot fetch table for %s.", url, team_id)
         return None
 
     html_content = response.text or ""
     if not html_content.strip():
-        logger.info(f"No table content available for team_id: {team_id}")
+        logger.info("No table content available for team_id: %s", team_id)
         return None
 
-    logger.debug(f"Parsing new HTML content for team table: {team_id}")
-    soup = BeautifulSoup(html_content, "lxml")
-    table_rows = soup.find_all("tr")
+    logger.debug("Parsing new HTML content for team table: %s", team_id)
+    soup = await _parse_html(html_content)
+    # Skip the header row at selector level rather than per-iteration.
+    table_rows = soup.select("table tr:not(.thead)")
 
     table_entries = []
     for row in table_rows:
-        if "thead" in row.get("class", []):
-            continue
-
-        cols = row.find_all("td")
+        cols = row.select("td")
         if len(cols) < 10:
             continue
 
-        row_classes = row.get("class", [])
+        # One attribute read per row; the set makes both checks O(1).
+        row_classes = set(row.get("class") or ())
         is_promotion = "promotion" in row_classes
         is_relegation = "relegation" in row_classes
 
@@ -528,7 +722,7 @@ async def get_team_table(team_id: str) -> Optional[Table]:
         try:
             entry = TableEntry(
                 place=int(cols[1].get_text(strip=True).replace(".", "")),
-                team=cols[2].find(class_="club-name").get_text(strip=True),
+                team=cols[2].select_one(".club-name").get_text(strip=True),
                 img=logo_url,
                 games=int(cols[3].get_text(strip=True)),
                 won=int(cols[4].get_text(strip=True)),
@@ -542,16 +736,16 @@ async def get_team_table(team_id: str) -> Optional[Table]:
             )
             table_entries.append(entry)
         except (ValueError, IndexError, AttributeError) as e:
-            logger.error(f"Error parsing table row for team {team_id}: {e}. Row content: {row}")
+            logger.error("Error parsing table row for team %s: %s. Row content: %s", team_id, e, row)
             continue
 
     if not table_entries:
-        logger.warning(f"Could not parse any table entries for team_id: {team_id}")
+        logger.warning("Could not parse any table entries for team_id: %s", team_id)
         return None
 
     table = Table(entries=table_entries)
 
-    logger.info(f"Parsed {len(table.entries)} table entries for team {team_id}")
+    logger.info("Parsed %s table entries for team %s", len(table.entries), team_id)
     return table
 
 
@@ -562,22 +756,22 @@ async def search_clubs(query: str) -> List[ClubSearchResult]:
     :param query: The search term for the club name.
     :return: A list of ClubSearchResult objects.
     """
-    logger.debug(f"Searching for clubs with query: '{query}'")
+    logger.debug("Searching for clubs with query: '%s'", query)
     # URL-encode the query to handle special characters
     encoded_query = quote(query)
     url = f"{FUSSBALL_DE_BASE_URL}/suche/-/text/{encoded_query}/restriction/CLUB_AND_TEAM"
 
-    response = await asyncio.to_thread(fetch_url, url)
+    response = await fetch_url(url)
     if response is None:
-        logger.warning(f"Request failed for club search with query: '{query}'")
+        logger.warning("Request failed for club search with query: '%s'", query)
         return []
 
     html_content = response.text or ""
-    soup = BeautifulSoup(html_content, "lxml")
+    soup = await _parse_html(html_content)
 
     club_list_div = soup.find("div", id="clublist")
     if not club_list_div:
-        logger.info(f"No club list found for query: '{query}'")
+        logger.info("No club list found for query: '%s'", query)
         return []
 
     clubs = []
@@ -612,30 +806,53 @@ async def search_clubs(query: str) -> List[ClubSearchResult]:
             )
         )
 
-    logger.info(f"Found {len(clubs)} clubs for query: '{query}'")
+    logger.info("Found %s clubs for query: '%s'", len(clubs), query)
     return clubs
 
 
+# Player names never change within a process lifetime and the same player
+# shows up across many events and games, so resolved profiles are memoized
+# by URL (failed fetches are not, so transient errors retry).
+_player_name_cache: Dict[str, Optional[str]] = {}
+
+
 async def _get_player_name_from_profile(profile_url: str) -> Optional[str]:
     """
     Load a player's profile from fussball.de and extract the plain name.
+    Results are memoized by URL, so repeat appearances cost a dict hit, and
+    concurrent lookups for the same profile share a single fetch.
 
     :param profile_url: Absolute URL to the player's profile.
     :return: The player's real name or None.
     """
-    response = await asyncio.to_thread(fetch_url, profile_url)
+    if profile_url in _player_name_cache:
+        return _player_name_cache[profile_url]
+
+    task = _player_inflight.get(profile_url)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_player_name(profile_url))
+        _player_inflight[profile_url] = task
+        task.add_done_callback(lambda _t: _player_inflight.pop(profile_url, None))
+    return await task
+
+
+async def _fetch_player_name(profile_url: str) -> Optional[str]:
+    """Fetches and parses one player profile, memoizing the result."""
+    name: Optional[str] = None
+    response = await fetch_url(profile_url)
     if response is None or response.status_code != 200:
-        logger.warning(f"Failed to fetch player profile: {profile_url}")
+        logger.warning("Failed to fetch player profile: %s", profile_url)
         return None
 
     try:
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = await _parse_html(response.text)
         tag = soup.find("p", class_="profile-name")
         if tag:
-            return tag.get_text(strip=True)
+            name = tag.get_text(strip=True)
     except Exception as e:
-        logger.error(f"Error parsing player profile {profile_url}: {e}")
-    return None
+        logger.error("Error parsing player profile %s: %s", profile_url, e)
+    _player_name_cache[profile_url] = name
+    return name
 
 
 async def _get_match_course(game_id: str) -> List[MatchEvent]:
@@ -646,66 +863,96 @@ async def _get_match_course(game_id: str) -> List[MatchEvent]:
     :return: A list of MatchEvent objects.
     """
     url = f"{FUSSBALL_DE_BASE_URL}/ajax.match.course/-/mode/PAGE/spiel/{game_id}"
-    response = await asyncio.to_thread(fetch_url, url)
+    response = await fetch_url(url)
     if response is None or response.status_code != 200:
-        logger.warning(f"Failed to fetch match course for game {game_id}")
+        logger.warning("Failed to fetch match course for game %s", game_id)
         return []
 
     html_content = response.text or ""
-    soup = BeautifulSoup(html_content, "lxml")
+    soup = await _parse_html(html_content)
+
+    events = await _parse_match_course(soup)
+    logger.debug("Extracted %s match events for game %s", len(events), game_id)
+    return events
+
+
+# Precompiled selectors for the match-course loop: these run several times
+# per event row, and compiling once skips soupsieve's pattern-cache probe on
+# every call.
+_SEL_COURSE_ROWS = sv.compile("#match_course_body .row-event")
+_SEL_TIME = sv.compile(".column-time .valign-inner")
+_SEL_EVENT = sv.compile(".column-event")
+_SEL_YELLOW_CARD = sv.compile(".icon-card.yellow-card")
+_SEL_RED_CARD = sv.compile(".icon-card.red-card")
+_SEL_SUBSTITUTE = sv.compile(".icon-substitute")
+_SEL_SUB_PLAYERS = sv.compile(".column-player .substitute")
+_SEL_PLAYER = sv.compile(".column-player")
+
+
+async def _parse_match_course(soup) -> List[MatchEvent]:
+    """
+    Parses match events out of an already-parsed tree containing
+    #match_course_body. Used both for the AJAX course endpoint and for
+    details pages that embed the course directly, so the latter avoid a
+    second fetch and parse.
+
+    :param soup: A parsed BeautifulSoup tree.
+    :return: A list of MatchEvent objects.
+    """
+    # Warm all font mappings for the course in one concurrent fan-out.
+    font_mappings = await _prefetch_font_mappings(soup)
 
     events: List[MatchEvent] = []
 
-    for row in soup.select("#match_course_body .row-event"):
-        side = "home" if "event-left" in row.get("class", []) else "away"
+    for row in _SEL_COURSE_ROWS.iselect(soup):
+        side = "home" if "event-left" in (row.get("class") or ()) else "away"
 
-        time_tag = row.select_one(".column-time .valign-inner")
+        time_tag = _SEL_TIME.select_one(row)
         time_text = time_tag.get_text(strip=True) if time_tag else None
 
         ev_type = "unknown"
         score = None
         desc = None
 
-        score_left = row.select_one(".column-event .score-left")
-        score_right = row.select_one(".column-event .score-right")
-
-        score_tag = row.select_one(".column-event")
+        score_tag = _SEL_EVENT.select_one(row)
         if score_tag:
-            score = await _deobfuscate_all(score_tag)
+            score = await _deobfuscate_all(score_tag, font_mappings)
             ev_type = "goal"
 
-        if row.select_one(".icon-card.yellow-card"):
+        if _SEL_YELLOW_CARD.select_one(row):
             ev_type = "yellow-card"
             desc = "Gelbe Karte"
-        if row.select_one(".icon-card.red-card"):
+        if _SEL_RED_CARD.select_one(row):
             ev_type = "red-card"
             desc = "Rote Karte"
 
-        if row.select_one(".icon-substitute"):
+        if _SEL_SUBSTITUTE.select_one(row):
             ev_type = "substitution"
             desc = "Auswechslung"
-            desc_tag = row.select_one(".column-player .substitute")
+            desc_tag = _SEL_SUB_PLAYERS.select_one(row)
             if desc_tag:
                 links = desc_tag.find_all("a", href=True)
-                names = []
-                for link in links:
-                    if "spielerprofil" in link["href"]:
-                        real_name = await _get_player_name_from_profile(link["href"])
-                        if real_name:
-                            names.append(real_name)
+                profile_urls = [
+                    link["href"] for link in links if "spielerprofil" in link["href"]
+                ]
+                # Both the incoming and outgoing player resolve in parallel.
+                resolved = await asyncio.gather(
+                    *(_get_player_name_from_profile(url) for url in profile_urls)
+                )
+                names = [name for name in resolved if name]
                 if len(names) == 2:
                     desc = f"{names[0]} für {names[1]}"
                 elif names:
                     desc = " / ".join(names)
 
         if not desc:
-            txt_tag = row.select_one(".column-player")
+            txt_tag = _SEL_PLAYER.select_one(row)
             if txt_tag:
                 profile_link = txt_tag.find("a", href=True)
                 if profile_link and "spielerprofil" in profile_link["href"]:
                     desc = await _get_player_name_from_profile(profile_link["href"])
                 else:
-                    desc = await _deobfuscate_all(txt_tag)
+                    desc = await _deobfuscate_all(txt_tag, font_mappings)
 
         events.append(
             MatchEvent(
@@ -717,10 +964,25 @@ async def _get_match_course(game_id: str) -> List[MatchEvent]:
             )
         )
 
-    logger.debug(f"Extracted {len(events)} match events for game {game_id}")
     return events
 
 
+def _stage_logo_url(team_div) -> str:
+    """
+    Extracts and normalizes a team logo URL from a stage-section team div,
+    preferring <span data-responsive-image> over a plain <img>.
+    """
+    logo_tag = team_div.select_one("span[data-responsive-image]") or team_div.select_one(
+        "img[src]"
+    )
+    if not logo_tag:
+        return ""
+    if logo_tag.has_attr("data-responsive-image"):
+        return normalize_logo_url(f"https:{logo_tag['data-responsive-image']}")
+    src = logo_tag["src"]
+    return normalize_logo_url(f"https:{src}" if src.startswith("//") else src)
+
+
 async def get_game_by_id(game_id: str) -> Optional[Game]:
     """
     Fetches and parses details of a single game by its game ID.
@@ -729,68 +991,50 @@ async def get_game_by_id(game_id: str) -> Optional[Game]:
     :return: A Game object with details and match_events, or None if not found.
     """
     details_url = f"{FUSSBALL_DE_BASE_URL}/spiel/-/spiel/{game_id}"
-    details_response = await asyncio.to_thread(fetch_url, details_url)
+    details_response = await fetch_url(details_url)
     if details_response is None or details_response.status_code != 200:
-        logger.error(f"Failed to fetch game details for game_id={game_id}")
+        logger.error("Failed to fetch game details for game_id=%s", game_id)
         return None
 
-    details_soup = BeautifulSoup(details_response.text or "", "lxml")
+    details_soup = await _parse_html(details_response.text or "")
 
-    stage_section = details_soup.find("section", id="stage")
+    stage_section = details_soup.select_one("section#stage")
     if not stage_section:
-        logger.warning(f"No stage section found for game {game_id}")
+        logger.warning("No stage section found for game %s", game_id)
         return None
 
     # Extract location
     location = None
     location_url = None
-    location_link = stage_section.find("a", class_="location")
+    location_link = stage_section.select_one("a.location")
     if location_link:
         location = location_link.get_text(strip=True).replace("Rasenplatz, ", "")
         location_url = location_link.get("href")
 
-    # Extract team names and logos (support both old and new class names)
-    home_team_div = stage_section.find("div", class_="team-left") or stage_section.find(
-        "div", class_="team-home"
-    )
-    away_team_div = stage_section.find("div", class_="team-right") or stage_section.find(
-        "div", class_="team-away"
-    )
+    # Extract team names and logos. The old/new class-name alternatives are
+    # folded into single grouped selectors so each lookup is one tree walk
+    # inside soupsieve instead of up to two find() passes.
+    home_team_div = stage_section.select_one("div.team-left, div.team-home")
+    away_team_div = stage_section.select_one("div.team-right, div.team-away")
     if not (home_team_div and away_team_div):
-        logger.warning(f"Could not parse team information for game {game_id}")
+        logger.warning("Could not parse team information for game %s", game_id)
         return None
 
     # Extract team names more robustly
-    home_team_name_tag = home_team_div.find("div", class_="team-name") or home_team_div
-    away_team_name_tag = away_team_div.find("div", class_="team-name") or away_team_div
+    home_team_name_tag = home_team_div.select_one("div.team-name") or home_team_div
+    away_team_name_tag = away_team_div.select_one("div.team-name") or away_team_div
     home_team_name = home_team_name_tag.get_text(strip=True)
     away_team_name = away_team_name_tag.get_text(strip=True)
 
     # Extract logos (support <span data-responsive-image> and <img>)
-    home_logo_span = home_team_div.find("span", attrs={"data-responsive-image": True})
-    away_logo_span = away_team_div.find("span", attrs={"data-responsive-image": True})
-    home_logo_img = home_team_div.find("img")
-    away_logo_img = away_team_div.find("img")
-
-    home_team_logo = ""
-    if home_logo_span and home_logo_span.has_attr("data-responsive-image"):
-        home_team_logo = normalize_logo_url(f"https:{home_logo_span['data-responsive-image']}")
-    elif home_logo_img and home_logo_img.has_attr("src"):
-        src = home_logo_img["src"]
-        home_team_logo = normalize_logo_url(f"https:{src}" if src.startswith("//") else src)
-
-    away_team_logo = ""
-    if away_logo_span and away_logo_span.has_attr("data-responsive-image"):
-        away_team_logo = normalize_logo_url(f"https:{away_logo_span['data-responsive-image']}")
-    elif away_logo_img and away_logo_img.has_attr("src"):
-        src = away_logo_img["src"]
-        away_team_logo = normalize_logo_url(f"https:{src}" if src.startswith("//") else src)
-
-    status_tag = stage_section.find("span", class_="info-text")
+    home_team_logo = _stage_logo_url(home_team_div)
+    away_team_logo = _stage_logo_url(away_team_div)
+
+    status_tag = stage_section.select_one("span.info-text")
     status = status_tag.get_text(strip=True) if status_tag else None
 
     # Extract final result (home/away score) if available
-    result_div = stage_section.find("div", class_="result")
+    result_div = stage_section.select_one("div.result")
     home_score = None
     away_score = None
     if result_div:
@@ -1,4 +1,7 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from .config import settings
 
@@ -8,9 +11,11 @@ def setup_logging():
     Configures the application's logging.
 
     This function sets up a unified logging format for the application
-    and for Uvicorn. It configures the root logger with a standard
-    stream handler and then removes Uvicorn's default handlers to ensure
-    all logs are processed by the root logger, resulting in a consistent format.
+    and for Uvicorn. Records are pushed onto an unbounded queue and a
+    background listener thread does the formatting and stream write, so a
+    slow stderr (container overlayfs, piped output) never blocks the event
+    loop. Uvicorn's default handlers are removed so all logs are processed
+    by the root logger, resulting in a consistent format.
     """
     log_level = settings.LOG_LEVEL.upper()
 
@@ -24,6 +29,15 @@ def setup_logging():
     )
     handler.setFormatter(formatter)
 
+    # Handlers attached to the root logger run on the calling thread, so the
+    # root only gets the queue handler; the listener drains it on its own
+    # thread and hands records to the stream handler.
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -31,7 +45,7 @@ def setup_logging():
     # Clear any existing handlers from root logger and add our new one
     if root_logger.hasHandlers():
         root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
 
     # Remove Uvicorn's default handlers and ensure propagation to root
     for name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
@@ -43,4 +57,4 @@ def setup_logging():
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
     # Log the initial configuration message using a specific app logger
-    logging.getLogger("fussball_api.config").info(f"Logging configured with level: {log_level}")
+    logging.getLogger("fussball_api.config").info("Logging configured with level: %s", log_level)
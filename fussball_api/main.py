@@ -1,12 +1,39 @@
 import asyncio
 import logging
-from typing import List
+import time
+from collections import defaultdict, deque
 
-from fastapi import Depends, FastAPI, HTTPException, Query, status
+import orjson
+from typing import Callable, List, Optional
+
+try:
+    # The whole app is I/O-bound fan-out, exactly the workload where uvloop's
+    # C-level selector beats the default loop. Installed before anything can
+    # grab an event loop; unavailable on Windows, where the default is kept.
+    import uvloop
+
+    uvloop.install()
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
-from .cache import load_caches_from_file, save_caches_to_file
+from .cache import (
+    close_http_client,
+    club_info_cache,
+    club_info_etag_cache,
+    club_info_gzip_cache,
+    club_info_json_cache,
+    game_index,
+    load_caches_from_file,
+    rebuild_indices,
+    save_caches_to_file,
+    team_index,
+)
 from .config import settings
 from .crawler import (
     get_club_next_games,
@@ -29,6 +56,7 @@ from .schemas import (
     TeamInfoResponse,
     TeamWithDetails,
 )
+from .responses import PydanticResponse
 from .security import get_api_key
 
 setup_logging()
@@ -39,6 +67,9 @@ app = FastAPI(
     title="Fussball.de API",
     description="A lightweight, self-hosted Python API to crawl and provide data from fussball.de.",
     version="1.0.0",
+    # orjson renders the big nested game/table payloads several times faster
+    # than stdlib json and emits bytes directly, skipping the str encode.
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -49,110 +80,454 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added after CORS so compression wraps the actual response body. The JSON
+# payloads repeat logo URL prefixes and competition names heavily, so gzip
+# typically shrinks them several-fold.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.mount("/examples", StaticFiles(directory="./examples"), name="examples")
 
+# fussball.de ids are alphanumeric tokens; rejecting anything else at the
+# route layer means a bogus id costs one regex match instead of a crawl.
+_ID_PATTERN = r"^[A-Za-z0-9-]{1,64}$"
+
+# Blob-cache key -> the endpoint-key kind used by the single-flight and
+# predictive-refresh bookkeeping.
+_BLOB_KIND = {
+    "full": "club_full",
+    "teams": "club_teams",
+    "info": "club_info",
+    "next_games": "club_next",
+    "prev_games": "club_prev",
+}
+
+
+def _cached_club_json(request: Request, club_id: str, key: str) -> Optional[Response]:
+    """
+    Returns the pre-serialized payload for one club endpoint, or None when the
+    club is not in the JSON cache.
+
+    Prefers the pre-gzipped variant when the client accepts gzip, so warm hits
+    skip both serialization and re-compression. Sends the blob's precomputed
+    ETag with a short Cache-Control lifetime; a matching If-None-Match from a
+    polling client short-circuits to a body-less 304.
+    """
+    _record_access(f"{_BLOB_KIND[key]}:{club_id}")
+    blobs = club_info_json_cache.get(club_id)
+    if not blobs:
+        return None
+
+    headers = {"Cache-Control": "public, max-age=60"}
+    etag = club_info_etag_cache.get(club_id, {}).get(key)
+    if etag:
+        headers["ETag"] = etag
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    gzipped = club_info_gzip_cache.get(club_id, {}).get(key)
+    if gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+        return Response(content=gzipped, media_type="application/json", headers=headers)
+    return Response(content=blobs[key], media_type="application/json", headers=headers)
+
+
+# Single-flight map for cold endpoint fetches: under bursty load, concurrent
+# requests for the same club, team or game share one crawl instead of each
+# triggering its own fetch fan-out against fussball.de. Mirrors the font and
+# player-profile single-flight maps in the crawler.
+_inflight: dict = {}
+
+
+async def _single_flight(key: str, coro_factory):
+    """
+    Runs coro_factory() at most once per key at a time; concurrent callers
+    await the same in-flight task. The entry removes itself on completion,
+    so results are not cached beyond the shared flight.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _inflight[key] = task
+        _last_fetch[key] = time.time()
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    return await task
+
+
+# Predictive prefetch bookkeeping: recent request times per endpoint key (the
+# same keys _single_flight uses) and the time of the last actual fetch. A
+# background loop estimates each key's inter-arrival gap and refreshes it
+# shortly before the next request would otherwise hit an expired cache, so
+# regular pollers never pay the "first request after TTL" spike.
+_access_log: "defaultdict[str, deque]" = defaultdict(lambda: deque(maxlen=16))
+_last_fetch: dict = {}
+
+_REFRESH_INTERVAL = 30.0
+
+# TTL of the cache behind each key kind, and the crawler call that refreshes
+# it. Lambdas so the module globals are resolved at call time.
+_REFRESH_KINDS = {
+    "club_full": (lambda: settings.CACHE_TTL_GAMES, lambda i: _build_full_club_info(i)),
+    "club_info": (lambda: settings.CACHE_TTL_GAMES, lambda i: _build_club_info(i)),
+    "club_teams": (lambda: settings.CACHE_TTL_TEAMS, lambda i: get_club_teams(i)),
+    "club_next": (lambda: settings.CACHE_TTL_GAMES, lambda i: get_club_next_games(i)),
+    "club_prev": (lambda: settings.CACHE_TTL_PREV_GAMES, lambda i: get_club_prev_games(i)),
+    "team_info": (lambda: settings.CACHE_TTL_GAMES, lambda i: _build_team_info(i)),
+    "team_table": (lambda: settings.CACHE_TTL_TABLE, lambda i: get_team_table(i)),
+    "team_next": (lambda: settings.CACHE_TTL_GAMES, lambda i: get_team_next_games(i)),
+    "team_prev": (lambda: settings.CACHE_TTL_PREV_GAMES, lambda i: get_team_prev_games(i)),
+    "game": (lambda: settings.CACHE_TTL_GAMES, lambda i: get_game_by_id(i)),
+}
+
+
+def _record_access(key: str) -> None:
+    """Notes a request for this key for the predictive refresh loop."""
+    _access_log[key].append(time.time())
+
+
+async def _refresh_quietly(key: str, coro) -> None:
+    """Awaits one background refresh, logging failures instead of leaving an
+    unretrieved task exception behind."""
+    try:
+        await coro
+    except Exception as e:
+        logger.error("Predictive refresh for %s failed: %s", key, e)
+
+
+async def _predictive_refresh_loop():
+    """
+    Periodically refreshes keys whose cache would expire before their next
+    predicted request. Only keys with an observable request rhythm (two or
+    more recent accesses, last one within a TTL) are considered; the
+    prewarmed club — including its teams and games, which are served from
+    the prewarmer-maintained indices — is skipped because the prewarmer
+    already keeps it fresh.
+    """
+    while True:
+        await asyncio.sleep(_REFRESH_INTERVAL)
+        try:
+            now = time.time()
+            for key, times in list(_access_log.items()):
+                if len(times) < 2:
+                    continue
+                kind, _, obj_id = key.partition(":")
+                ttl_fn, refresh = _REFRESH_KINDS[kind]
+                ttl = ttl_fn()
+                if now - times[-1] > ttl:
+                    # No request for a full TTL: the key went cold.
+                    del _access_log[key]
+                    continue
+                if settings.PREWARM_CLUB_ID and settings.PREWARM_CLUB_ID == obj_id:
+                    continue
+                # Teams and games present in the indices belong to the
+                # prewarmed club: the prewarmer refreshes them on its own
+                # per-kind TTLs, and warm index hits never record a fetch,
+                # so the expiry estimate below would always look stale.
+                if kind.startswith("team_") and obj_id in team_index:
+                    continue
+                if kind == "game" and obj_id in game_index:
+                    continue
+                mean_gap = (times[-1] - times[0]) / (len(times) - 1)
+                expires_at = _last_fetch.get(key, 0.0) + ttl
+                if expires_at < now + mean_gap:
+                    logger.debug("Predictive refresh for %s", key)
+                    asyncio.ensure_future(
+                        _refresh_quietly(
+                            key,
+                            _single_flight(key, lambda k=kind, i=obj_id: _REFRESH_KINDS[k][1](i)),
+                        )
+                    )
+        except Exception as e:
+            logger.error("Predictive refresh loop failed: %s", e)
+
 
 async def prewarm_cache():
     """
-    A background task that periodically fetches data for a configured club
-    to keep the cache warm. Limits concurrent requests with a semaphore.
+    A background task that periodically refreshes data for a configured club
+    to keep the cache warm. The first cycle builds the full club object; later
+    cycles only refetch sub-objects whose per-kind TTL has expired and merge
+    the results in place. Upstream concurrency is bounded by the shared fetch
+    semaphore in cache.fetch_url.
     """
     logger.info(
-        f"Starting cache pre-warming for club ID: {settings.PREWARM_CLUB_ID} "
-        f"with an interval of {settings.PREWARM_INTERVAL_SECONDS} seconds."
+        "Starting cache pre-warming for club ID: %s with an interval of %s seconds.",
+        settings.PREWARM_CLUB_ID,
+        settings.PREWARM_INTERVAL_SECONDS,
     )
-    sem = asyncio.Semaphore(5)
 
-    async def run_with_limit(coro):
-        async with sem:
-            return await coro
+    # Cycles start on fixed monotonic deadlines rather than sleeping a full
+    # interval after each run, so slow cycles do not push every later one
+    # back and cache staleness stays bounded. Missed ticks are dropped, not
+    # queued up.
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
 
     while True:
         try:
             club_id = settings.PREWARM_CLUB_ID
-            logger.info(f"Running pre-warming cycle for club: {club_id}")
+            logger.info("Running pre-warming cycle for club: %s", club_id)
 
-            # First, fetch the list of teams for the club.
-            teams = await get_club_teams(club_id)
-            tasks = []
-            if not teams:
-                logger.warning(f"Pre-warming: Could not fetch teams for club {club_id}.")
+            cached = club_info_cache.get(club_id)
+            if cached is None:
+                await _full_prewarm_build(club_id)
             else:
-                # Prepare all data fetching tasks.
-                tasks = [
-                    run_with_limit(get_club_next_games(club_id)),
-                    run_with_limit(get_club_prev_games(club_id)),
-                ]
-                for team in teams:
-                    tasks.append(run_with_limit(get_team_next_games(team.id)))
-                    tasks.append(run_with_limit(get_team_prev_games(team.id)))
-                    tasks.append(run_with_limit(get_team_table(team.id)))
-
-                # Execute all tasks concurrently, ignoring individual errors.
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Pre-warming task failed with exception: {result}")
-
-            # Build and cache full club info object
-            from .schemas import FullClubInfoResponse, TeamWithDetails
-            from .cache import club_info_cache
-            try:
-                if teams:
-                    teams_with_details = []
-                    for i, team in enumerate(teams):
-                        next_games = results[2 + i*3]
-                        prev_games = results[2 + i*3 + 1]
-                        table = results[2 + i*3 + 2]
-                        teams_with_details.append(
-                            TeamWithDetails(
-                                **team.model_dump(),
-                                table=table,
-                                next_games=next_games,
-                                prev_games=prev_games,
-                            )
-                        )
-                    club_info_cache[club_id] = FullClubInfoResponse(
-                        club_prev_games=results[1],
-                        club_next_games=results[0],
-                        teams=teams_with_details,
-                    )
-                    logger.debug(f"Updated club_info_cache for {club_id} with {len(teams_with_details)} teams")
-            except Exception as e:
-                logger.error(f"Failed to build full club info object during pre-warming: {e}")
+                await _incremental_prewarm(club_id, cached)
 
-            logger.info(f"Pre-warming cycle for club {club_id} completed.")
+            logger.info("Pre-warming cycle for club %s completed.", club_id)
 
         except Exception as e:
-            logger.critical(f"An unexpected error occurred in the pre-warming task: {e}")
+            logger.critical("An unexpected error occurred in the pre-warming task: %s", e)
 
-        # Wait for the configured interval before the next run.
-        await asyncio.sleep(settings.PREWARM_INTERVAL_SECONDS)
+        next_deadline += settings.PREWARM_INTERVAL_SECONDS
+        sleep_for = next_deadline - loop.time()
+        if sleep_for <= 0.0:
+            logger.warning(
+                "Pre-warming cycle overran its %ss interval by %.1fs.",
+                settings.PREWARM_INTERVAL_SECONDS,
+                -sleep_for,
+            )
+            next_deadline = loop.time()
+            sleep_for = 0.0
+        await asyncio.sleep(sleep_for)
 
 
-@app.on_event("startup")
-async def startup_event():
+# Wall-clock fetch time per prewarmed sub-object, keyed by (kind, id). Tables
+# change weekly and past games daily, so refetching everything each cycle
+# mostly re-downloads unchanged data; this lets each kind age out on its own
+# TTL instead.
+_prewarm_fetched_at: dict = {}
+
+_PREWARM_TTLS = {
+    "teams": lambda: settings.CACHE_TTL_TEAMS,
+    "club_next": lambda: settings.CACHE_TTL_GAMES,
+    "club_prev": lambda: settings.CACHE_TTL_PREV_GAMES,
+    "table": lambda: settings.CACHE_TTL_TABLE,
+    "next": lambda: settings.CACHE_TTL_GAMES,
+    "prev": lambda: settings.CACHE_TTL_PREV_GAMES,
+}
+
+
+def _prewarm_stale(kind: str, obj_id: str, now: float) -> bool:
+    """True when the cached sub-object has outlived its per-kind TTL."""
+    fetched_at = _prewarm_fetched_at.get((kind, obj_id), 0.0)
+    return now - fetched_at >= _PREWARM_TTLS[kind]()
+
+
+# Sentinel distinguishing "fetch failed" from legitimate empty results.
+_FETCH_FAILED = object()
+
+
+async def _quiet(coro):
     """
-    Actions to perform on application startup.
-    - Starts the cache pre-warming background task if configured.
+    Shields the surrounding TaskGroup from a single fetch failure: logs the
+    error and returns _FETCH_FAILED instead of raising, so one broken team
+    does not cancel the sibling fetches or poison the club snapshot.
+    """
+    try:
+        return await coro
+    except Exception as e:
+        logger.error("Pre-warming fetch failed: %s", e)
+        return _FETCH_FAILED
+
+
+async def _full_prewarm_build(club_id: str) -> None:
     """
-    # Load caches if available
-    load_caches_from_file()
+    Cold path: fetches everything for the club and builds the cached object
+    from scratch. One TaskGroup drives all fetches; a failure cancels the
+    remaining siblings so a broken cycle ends quickly instead of finishing
+    fetches whose results will be discarded.
+    """
+    teams = await get_club_teams(club_id)
+    if not teams:
+        logger.warning("Pre-warming: Could not fetch teams for club %s.", club_id)
+        return
+
+    async with asyncio.TaskGroup() as tg:
+        club_next_t = tg.create_task(get_club_next_games(club_id))
+        club_prev_t = tg.create_task(get_club_prev_games(club_id))
+        team_tasks = [
+            (
+                tg.create_task(_quiet(get_team_table(team.id))),
+                tg.create_task(_quiet(get_team_next_games(team.id))),
+                tg.create_task(_quiet(get_team_prev_games(team.id))),
+            )
+            for team in teams
+        ]
+
+    # Build and cache full club info object
+    try:
+        teams_with_details = []
+        for team, (table_t, next_t, prev_t) in zip(teams, team_tasks):
+            table = table_t.result()
+            next_games = next_t.result()
+            prev_games = prev_t.result()
+            teams_with_details.append(
+                TeamWithDetails(
+                    **team.model_dump(),
+                    table=None if table is _FETCH_FAILED else table,
+                    next_games=[] if next_games is _FETCH_FAILED else next_games,
+                    prev_games=[] if prev_games is _FETCH_FAILED else prev_games,
+                )
+            )
+        club_info_cache[club_id] = FullClubInfoResponse(
+            club_prev_games=club_prev_t.result(),
+            club_next_games=club_next_t.result(),
+            teams=teams_with_details,
+        )
+        rebuild_indices()
+
+        now = time.time()
+        _prewarm_fetched_at[("teams", club_id)] = now
+        _prewarm_fetched_at[("club_next", club_id)] = now
+        _prewarm_fetched_at[("club_prev", club_id)] = now
+        for team in teams:
+            for kind in ("table", "next", "prev"):
+                _prewarm_fetched_at[(kind, team.id)] = now
+
+        logger.debug("Updated club_info_cache for %s with %s teams", club_id, len(teams_with_details))
+    except Exception as e:
+        logger.error("Failed to build full club info object during pre-warming: %s", e)
+
+
+async def _incremental_prewarm(club_id: str, cached) -> None:
+    """
+    Warm path: refetches only the sub-objects whose TTL expired and merges
+    them into the cached club object in place, so the cache stays servable
+    throughout and unchanged data is not re-downloaded.
+    """
+    now = time.time()
+    async with asyncio.TaskGroup() as tg:
+        tasks = {}
+        if _prewarm_stale("teams", club_id, now):
+            tasks[("teams", club_id)] = tg.create_task(_quiet(get_club_teams(club_id)))
+        if _prewarm_stale("club_next", club_id, now):
+            tasks[("club_next", club_id)] = tg.create_task(_quiet(get_club_next_games(club_id)))
+        if _prewarm_stale("club_prev", club_id, now):
+            tasks[("club_prev", club_id)] = tg.create_task(_quiet(get_club_prev_games(club_id)))
+        for team in cached.teams:
+            if _prewarm_stale("table", team.id, now):
+                tasks[("table", team.id)] = tg.create_task(_quiet(get_team_table(team.id)))
+            if _prewarm_stale("next", team.id, now):
+                tasks[("next", team.id)] = tg.create_task(_quiet(get_team_next_games(team.id)))
+            if _prewarm_stale("prev", team.id, now):
+                tasks[("prev", team.id)] = tg.create_task(_quiet(get_team_prev_games(team.id)))
+
+    if not tasks:
+        logger.debug("Pre-warming: all sub-objects for %s still fresh.", club_id)
+        return
+
+    # A changed roster invalidates the per-team layout; rebuild from scratch.
+    teams_task = tasks.get(("teams", club_id))
+    if teams_task is not None and teams_task.result() is not _FETCH_FAILED:
+        _prewarm_fetched_at[("teams", club_id)] = now
+        new_ids = {team.id for team in teams_task.result()}
+        if new_ids != {team.id for team in cached.teams}:
+            logger.info("Pre-warming: team roster for %s changed, rebuilding.", club_id)
+            await _full_prewarm_build(club_id)
+            return
+
+    team_by_id = {team.id: team for team in cached.teams}
+    for (kind, obj_id), task in tasks.items():
+        result = task.result()
+        if result is _FETCH_FAILED:
+            # Keep the stale value; the TTL stays expired so the next cycle
+            # retries this sub-object.
+            continue
+        _prewarm_fetched_at[(kind, obj_id)] = now
+        if kind == "club_next":
+            cached.club_next_games = result
+        elif kind == "club_prev":
+            cached.club_prev_games = result
+        elif kind == "table":
+            team_by_id[obj_id].table = result
+        elif kind == "next":
+            team_by_id[obj_id].next_games = result
+        elif kind == "prev":
+            team_by_id[obj_id].prev_games = result
+
+    rebuild_indices()
+    logger.debug(
+        "Pre-warming: refreshed %s stale sub-objects for %s.", len(tasks), club_id
+    )
+
+
+async def _load_caches_then_prewarm():
+    """
+    Loads the persisted caches in a worker thread, then starts the prewarmer.
+
+    Keeping the disk load off the event loop lets uvicorn accept requests
+    immediately; endpoints fall back to live fetches until the load lands,
+    and the prewarmer only starts afterwards so its first cycle sees the
+    restored cache instead of rebuilding it.
+    """
+    await asyncio.to_thread(load_caches_from_file)
     logger.info("Persistent cache loaded from file (if it existed).")
 
     if settings.PREWARM_CLUB_ID:
-        asyncio.create_task(prewarm_cache())
+        await prewarm_cache()
     else:
         logger.info("Cache pre-warming is disabled. Set PREWARM_CLUB_ID to enable it.")
 
 
+@app.on_event("startup")
+async def startup_event():
+    """
+    Actions to perform on application startup.
+    - Loads the persisted caches and starts pre-warming in the background.
+    """
+    logger.info("Event loop implementation: %s", type(asyncio.get_running_loop()).__name__)
+    asyncio.create_task(_load_caches_then_prewarm())
+    asyncio.create_task(_predictive_refresh_loop())
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """
     Actions to perform on application shutdown.
     """
-    save_caches_to_file()
+    # In a worker thread so the final dump (serialize + write + fsync) does
+    # not block the loop while in-flight requests drain.
+    await asyncio.to_thread(save_caches_to_file)
     logger.info("Persistent cache saved to file.")
+    await close_http_client()
+
+
+
+# Thin dependency providers for the crawler entry points. Endpoints receive
+# the crawler callables via Depends instead of referencing module globals, so
+# tests swap them through app.dependency_overrides instead of monkeypatching
+# this module. Each provider reads the global at call time, so runtime
+# rebinding still takes effect.
+def provide_search_clubs() -> Callable:
+    return search_clubs
+
+
+def provide_club_teams() -> Callable:
+    return get_club_teams
+
+
+def provide_club_next_games() -> Callable:
+    return get_club_next_games
+
+
+def provide_club_prev_games() -> Callable:
+    return get_club_prev_games
+
+
+def provide_team_table() -> Callable:
+    return get_team_table
+
+
+def provide_team_next_games() -> Callable:
+    return get_team_next_games
+
+
+def provide_team_prev_games() -> Callable:
+    return get_team_prev_games
+
+
+def provide_game_by_id() -> Callable:
+    return get_game_by_id
 
 
 @app.get("/")
@@ -169,14 +544,17 @@ async def read_root():
     response_model=List[ClubSearchResult],
     dependencies=[Depends(get_api_key)],
 )
-async def search_for_clubs(query: str = Query(..., min_length=3)):
+async def search_for_clubs(
+    query: str = Query(..., min_length=3),
+    fetch_clubs: Callable = Depends(provide_search_clubs),
+):
     """
     Searches for clubs by a given query string.
 
     :param query: The search term (must be at least 3 characters long).
     :return: A list of clubs matching the search query.
     """
-    return await search_clubs(query)
+    return PydanticResponse(await fetch_clubs(query))
 
 
 @app.get(
@@ -184,7 +562,16 @@ async def search_for_clubs(query: str = Query(..., min_length=3)):
     response_model=FullClubInfoResponse,
     dependencies=[Depends(get_api_key)],
 )
-async def read_full_club_info(club_id: str):
+async def read_full_club_info(
+    request: Request,
+    club_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_teams: Callable = Depends(provide_club_teams),
+    fetch_club_next: Callable = Depends(provide_club_next_games),
+    fetch_club_prev: Callable = Depends(provide_club_prev_games),
+    fetch_table: Callable = Depends(provide_team_table),
+    fetch_team_next: Callable = Depends(provide_team_next_games),
+    fetch_team_prev: Callable = Depends(provide_team_prev_games),
+):
     """
     Retrieves all available information for a club in a single response.
 
@@ -196,51 +583,92 @@ async def read_full_club_info(club_id: str):
     :param club_id: The unique ID of the club from fussball.de.
     :return: A comprehensive club information object.
     """
-    from .cache import club_info_cache
-    cached = club_info_cache.get(club_id)
+    cached = _cached_club_json(request, club_id, "full")
     if cached:
-        logger.debug(f"Serving FullClubInfoResponse for {club_id} from object cache")
+        logger.debug("Serving FullClubInfoResponse for %s from JSON cache", club_id)
         return cached
+    full = await _single_flight(
+        f"club_full:{club_id}",
+        lambda: _build_full_club_info(
+            club_id,
+            fetch_teams=fetch_teams,
+            fetch_club_next=fetch_club_next,
+            fetch_club_prev=fetch_club_prev,
+            fetch_table=fetch_table,
+            fetch_team_next=fetch_team_next,
+            fetch_team_prev=fetch_team_prev,
+        ),
+    )
+    return StreamingResponse(_stream_full_club(full), media_type="application/json")
 
-    # First, get the list of teams for the club.
-    teams_list = await get_club_teams(club_id)
-
-    # Prepare all other data fetching tasks.
-    tasks = [
-        get_club_next_games(club_id),
-        get_club_prev_games(club_id),
-    ]
-    for team in teams_list:
-        tasks.append(get_team_table(team.id))
-        tasks.append(get_team_next_games(team.id))
-        tasks.append(get_team_prev_games(team.id))
 
-    # Execute all tasks concurrently.
-    results = await asyncio.gather(*tasks)
+async def _stream_full_club(payload: FullClubInfoResponse):
+    """
+    Yields the full club response as JSON chunks, one team at a time, so the
+    first bytes reach the client while the remaining teams are still being
+    serialized. Only used on the cold path; warm hits are served as one
+    pre-serialized blob.
+    """
+    yield b'{"club_prev_games":'
+    yield orjson.dumps([game.model_dump(mode="json") for game in payload.club_prev_games])
+    yield b',"club_next_games":'
+    yield orjson.dumps([game.model_dump(mode="json") for game in payload.club_next_games])
+    yield b',"teams":['
+    for i, team in enumerate(payload.teams):
+        if i:
+            yield b","
+        yield orjson.dumps(team.model_dump(mode="json"))
+    yield b"]}"
+
+
+async def _build_full_club_info(
+    club_id: str,
+    fetch_teams: Optional[Callable] = None,
+    fetch_club_next: Optional[Callable] = None,
+    fetch_club_prev: Optional[Callable] = None,
+    fetch_table: Optional[Callable] = None,
+    fetch_team_next: Optional[Callable] = None,
+    fetch_team_prev: Optional[Callable] = None,
+) -> FullClubInfoResponse:
+    """Fetches and assembles the full club response from the crawler."""
+    fetch_teams = fetch_teams or get_club_teams
+    fetch_club_next = fetch_club_next or get_club_next_games
+    fetch_club_prev = fetch_club_prev or get_club_prev_games
+    fetch_table = fetch_table or get_team_table
+    fetch_team_next = fetch_team_next or get_team_next_games
+    fetch_team_prev = fetch_team_prev or get_team_prev_games
 
-    # Unpack the results.
-    club_next_games = results[0]
-    club_prev_games = results[1]
-    team_data_results = results[2:]
+    # First, get the list of teams for the club.
+    teams_list = await fetch_teams(club_id)
+
+    # Fetch everything else concurrently; the shared fetch semaphore in
+    # cache.fetch_url keeps the upstream fan-out bounded.
+    async with asyncio.TaskGroup() as tg:
+        club_next_t = tg.create_task(fetch_club_next(club_id))
+        club_prev_t = tg.create_task(fetch_club_prev(club_id))
+        team_tasks = [
+            (
+                tg.create_task(fetch_table(team.id)),
+                tg.create_task(fetch_team_next(team.id)),
+                tg.create_task(fetch_team_prev(team.id)),
+            )
+            for team in teams_list
+        ]
 
     # Assemble the detailed team information.
-    teams_with_details = []
-    for i, team in enumerate(teams_list):
-        table = team_data_results[i * 3]
-        next_games = team_data_results[i * 3 + 1]
-        prev_games = team_data_results[i * 3 + 2]
-
-        team_details = TeamWithDetails(
+    teams_with_details = [
+        TeamWithDetails(
             **team.model_dump(),
-            table=table,
-            next_games=next_games,
-            prev_games=prev_games,
+            table=table_t.result(),
+            next_games=next_t.result(),
+            prev_games=prev_t.result(),
         )
-        teams_with_details.append(team_details)
+        for team, (table_t, next_t, prev_t) in zip(teams_list, team_tasks)
+    ]
 
     return FullClubInfoResponse(
-        club_next_games=club_next_games,
-        club_prev_games=club_prev_games,
+        club_next_games=club_next_t.result(),
+        club_prev_games=club_prev_t.result(),
         teams=teams_with_details,
     )
 
@@ -250,19 +678,24 @@ async def read_full_club_info(club_id: str):
     response_model=List[Team],
     dependencies=[Depends(get_api_key)],
 )
-async def read_club_teams(club_id: str):
+async def read_club_teams(
+    request: Request,
+    club_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_teams: Callable = Depends(provide_club_teams),
+):
     """
     Retrieves all teams for a given club ID.
 
     :param club_id: The unique ID of the club from fussball.de.
     :return: A list of teams.
     """
-    from .cache import club_info_cache
-    cached = club_info_cache.get(club_id)
+    cached = _cached_club_json(request, club_id, "teams")
     if cached:
-        logger.debug(f"Serving teams for club {club_id} from object cache")
-        return [Team(**team.model_dump()) for team in cached.teams]
-    return await get_club_teams(club_id)
+        logger.debug("Serving teams for club %s from JSON cache", club_id)
+        return cached
+    return PydanticResponse(
+        await _single_flight(f"club_teams:{club_id}", lambda: fetch_teams(club_id))
+    )
 
 
 @app.get(
@@ -270,7 +703,13 @@ async def read_club_teams(club_id: str):
     response_model=ClubInfoResponse,
     dependencies=[Depends(get_api_key)],
 )
-async def read_club_info(club_id: str):
+async def read_club_info(
+    request: Request,
+    club_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_teams: Callable = Depends(provide_club_teams),
+    fetch_next: Callable = Depends(provide_club_next_games),
+    fetch_prev: Callable = Depends(provide_club_prev_games),
+):
     """
     Retrieves combined information for a club, including teams,
     next games, and previous games.
@@ -278,18 +717,30 @@ async def read_club_info(club_id: str):
     :param club_id: The unique ID of the club from fussball.de.
     :return: Combined club information.
     """
-    from .cache import club_info_cache
-    cached = club_info_cache.get(club_id)
+    cached = _cached_club_json(request, club_id, "info")
     if cached:
-        logger.debug(f"Serving ClubInfoResponse for {club_id} from object cache")
-        return ClubInfoResponse(
-            teams=[Team(**team.model_dump(exclude={"table","prev_games","next_games"})) for team in cached.teams],
-            next_games=cached.club_next_games,
-            prev_games=cached.club_prev_games,
+        logger.debug("Serving ClubInfoResponse for %s from JSON cache", club_id)
+        return cached
+    return PydanticResponse(
+        await _single_flight(
+            f"club_info:{club_id}",
+            lambda: _build_club_info(
+                club_id, fetch_teams=fetch_teams, fetch_next=fetch_next, fetch_prev=fetch_prev
+            ),
         )
-    teams_task = get_club_teams(club_id)
-    next_games_task = get_club_next_games(club_id)
-    prev_games_task = get_club_prev_games(club_id)
+    )
+
+
+async def _build_club_info(
+    club_id: str,
+    fetch_teams: Optional[Callable] = None,
+    fetch_next: Optional[Callable] = None,
+    fetch_prev: Optional[Callable] = None,
+) -> ClubInfoResponse:
+    """Fetches and assembles the combined club response from the crawler."""
+    teams_task = (fetch_teams or get_club_teams)(club_id)
+    next_games_task = (fetch_next or get_club_next_games)(club_id)
+    prev_games_task = (fetch_prev or get_club_prev_games)(club_id)
 
     teams, next_games, prev_games = await asyncio.gather(
         teams_task, next_games_task, prev_games_task
@@ -307,7 +758,12 @@ async def read_club_info(club_id: str):
     response_model=TeamInfoResponse,
     dependencies=[Depends(get_api_key)],
 )
-async def read_team_info(team_id: str):
+async def read_team_info(
+    team_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_table: Callable = Depends(provide_team_table),
+    fetch_next: Callable = Depends(provide_team_next_games),
+    fetch_prev: Callable = Depends(provide_team_prev_games),
+):
     """
     Retrieves combined information for a team, including the league table,
     next games, and previous games.
@@ -315,19 +771,37 @@ async def read_team_info(team_id: str):
     :param team_id: The unique ID of the team from fussball.de.
     :return: Combined team information.
     """
-    from .cache import club_info_cache
-    for club_id, cached in club_info_cache.items():
-        for team in cached.teams:
-            if team.id == team_id:
-                logger.debug(f"Serving TeamInfoResponse for {team_id} from object cache")
-                return TeamInfoResponse(
-                    table=team.table,
-                    prev_games=team.prev_games,
-                    next_games=team.next_games,
-                )
-    table_task = get_team_table(team_id)
-    next_games_task = get_team_next_games(team_id)
-    prev_games_task = get_team_prev_games(team_id)
+    _record_access(f"team_info:{team_id}")
+    team = team_index.get(team_id)
+    if team:
+        logger.debug("Serving TeamInfoResponse for %s from object cache", team_id)
+        return PydanticResponse(
+            TeamInfoResponse(
+                table=team.table,
+                prev_games=team.prev_games,
+                next_games=team.next_games,
+            )
+        )
+    return PydanticResponse(
+        await _single_flight(
+            f"team_info:{team_id}",
+            lambda: _build_team_info(
+                team_id, fetch_table=fetch_table, fetch_next=fetch_next, fetch_prev=fetch_prev
+            ),
+        )
+    )
+
+
+async def _build_team_info(
+    team_id: str,
+    fetch_table: Optional[Callable] = None,
+    fetch_next: Optional[Callable] = None,
+    fetch_prev: Optional[Callable] = None,
+) -> TeamInfoResponse:
+    """Fetches and assembles the combined team response from the crawler."""
+    table_task = (fetch_table or get_team_table)(team_id)
+    next_games_task = (fetch_next or get_team_next_games)(team_id)
+    prev_games_task = (fetch_prev or get_team_prev_games)(team_id)
 
     table, next_games, prev_games = await asyncio.gather(
         table_task, next_games_task, prev_games_task
@@ -345,7 +819,10 @@ async def read_team_info(team_id: str):
     response_model=Table,
     dependencies=[Depends(get_api_key)],
 )
-async def read_team_table(team_id: str):
+async def read_team_table(
+    team_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_table: Callable = Depends(provide_team_table),
+):
     """
     Retrieves the league table for a given team ID.
 
@@ -353,19 +830,18 @@ async def read_team_table(team_id: str):
     :return: The league table.
     :raises HTTPException: If no table is found for the team.
     """
-    from .cache import club_info_cache
-    for club_id, cached in club_info_cache.items():
-        for team in cached.teams:
-            if team.id == team_id and team.table is not None:
-                logger.debug(f"Serving table for team {team_id} from object cache")
-                return team.table
-    table = await get_team_table(team_id)
+    _record_access(f"team_table:{team_id}")
+    team = team_index.get(team_id)
+    if team and team.table is not None:
+        logger.debug("Serving table for team %s from object cache", team_id)
+        return PydanticResponse(team.table)
+    table = await _single_flight(f"team_table:{team_id}", lambda: fetch_table(team_id))
     if table is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Table not found for this team.",
         )
-    return table
+    return PydanticResponse(table)
 
 
 @app.get(
@@ -373,19 +849,24 @@ async def read_team_table(team_id: str):
     response_model=List[Game],
     dependencies=[Depends(get_api_key)],
 )
-async def read_club_next_games(club_id: str):
+async def read_club_next_games(
+    request: Request,
+    club_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_next: Callable = Depends(provide_club_next_games),
+):
     """
     Retrieves the upcoming games for all teams of a given club.
 
     :param club_id: The unique ID of the club from fussball.de.
     :return: A list of games.
     """
-    from .cache import club_info_cache
-    cached = club_info_cache.get(club_id)
+    cached = _cached_club_json(request, club_id, "next_games")
     if cached:
-        logger.debug(f"Serving club_next_games for {club_id} from object cache")
-        return cached.club_next_games
-    return await get_club_next_games(club_id)
+        logger.debug("Serving club_next_games for %s from JSON cache", club_id)
+        return cached
+    return PydanticResponse(
+        await _single_flight(f"club_next:{club_id}", lambda: fetch_next(club_id))
+    )
 
 
 @app.get(
@@ -393,19 +874,24 @@ async def read_club_next_games(club_id: str):
     response_model=List[Game],
     dependencies=[Depends(get_api_key)],
 )
-async def read_club_prev_games(club_id: str):
+async def read_club_prev_games(
+    request: Request,
+    club_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_prev: Callable = Depends(provide_club_prev_games),
+):
     """
     Retrieves the past games for all teams of a given club.
 
     :param club_id: The unique ID of the club from fussball.de.
     :return: A list of games.
     """
-    from .cache import club_info_cache
-    cached = club_info_cache.get(club_id)
+    cached = _cached_club_json(request, club_id, "prev_games")
     if cached:
-        logger.debug(f"Serving club_prev_games for {club_id} from object cache")
-        return cached.club_prev_games
-    return await get_club_prev_games(club_id)
+        logger.debug("Serving club_prev_games for %s from JSON cache", club_id)
+        return cached
+    return PydanticResponse(
+        await _single_flight(f"club_prev:{club_id}", lambda: fetch_prev(club_id))
+    )
 
 
 @app.get(
@@ -413,20 +899,24 @@ async def read_club_prev_games(club_id: str):
     response_model=List[Game],
     dependencies=[Depends(get_api_key)],
 )
-async def read_team_next_games(team_id: str):
+async def read_team_next_games(
+    team_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_next: Callable = Depends(provide_team_next_games),
+):
     """
     Retrieves the upcoming games for a given team.
 
     :param team_id: The unique ID of the team from fussball.de.
     :return: A list of games.
     """
-    from .cache import club_info_cache
-    for club_id, cached in club_info_cache.items():
-        for team in cached.teams:
-            if team.id == team_id:
-                logger.debug(f"Serving next_games for team {team_id} from object cache")
-                return team.next_games
-    return await get_team_next_games(team_id)
+    _record_access(f"team_next:{team_id}")
+    team = team_index.get(team_id)
+    if team:
+        logger.debug("Serving next_games for team %s from object cache", team_id)
+        return PydanticResponse(team.next_games)
+    return PydanticResponse(
+        await _single_flight(f"team_next:{team_id}", lambda: fetch_next(team_id))
+    )
 
 
 @app.get(
@@ -434,20 +924,24 @@ async def read_team_next_games(team_id: str):
     response_model=List[Game],
     dependencies=[Depends(get_api_key)],
 )
-async def read_team_prev_games(team_id: str):
+async def read_team_prev_games(
+    team_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_prev: Callable = Depends(provide_team_prev_games),
+):
     """
     Retrieves the past games for a given team.
 
     :param team_id: The unique ID of the team from fussball.de.
     :return: A list of games.
     """
-    from .cache import club_info_cache
-    for club_id, cached in club_info_cache.items():
-        for team in cached.teams:
-            if team.id == team_id:
-                logger.debug(f"Serving prev_games for team {team_id} from object cache")
-                return team.prev_games
-    return await get_team_prev_games(team_id)
+    _record_access(f"team_prev:{team_id}")
+    team = team_index.get(team_id)
+    if team:
+        logger.debug("Serving prev_games for team %s from object cache", team_id)
+        return PydanticResponse(team.prev_games)
+    return PydanticResponse(
+        await _single_flight(f"team_prev:{team_id}", lambda: fetch_prev(team_id))
+    )
 
 
 @app.get(
@@ -455,7 +949,10 @@ async def read_team_prev_games(team_id: str):
     response_model=Game,
     dependencies=[Depends(get_api_key)],
 )
-async def read_game_by_id(game_id: str):
+async def read_game_by_id(
+    game_id: str = Path(..., pattern=_ID_PATTERN),
+    fetch_game: Callable = Depends(provide_game_by_id),
+):
     """
     Retrieves the details and match events for a single game.
 
@@ -463,26 +960,18 @@ async def read_game_by_id(game_id: str):
     :return: The Game object with details and match events.
     :raises HTTPException: If the game could not be fetched or parsed.
     """
-    from .cache import club_info_cache
+    _record_access(f"game:{game_id}")
 
     # Try to serve from prewarmed object cache first
-    for club_id, cached in club_info_cache.items():
-        # Club-level games
-        for g in cached.club_next_games + cached.club_prev_games:
-            if g.id == game_id:
-                logger.debug(f"Serving game {game_id} from object cache (club-level)")
-                return g
-        # Team-level games
-        for team in cached.teams:
-            for g in team.next_games + team.prev_games:
-                if g.id == game_id:
-                    logger.debug(f"Serving game {game_id} from object cache (team-level)")
-                    return g
+    cached_game = game_index.get(game_id)
+    if cached_game:
+        logger.debug("Serving game %s from object cache", game_id)
+        return PydanticResponse(cached_game)
 
-    game = await get_game_by_id(game_id)
+    game = await _single_flight(f"game:{game_id}", lambda: fetch_game(game_id))
     if not game:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Game {game_id} not found or could not be parsed.",
         )
-    return game
+    return PydanticResponse(game)
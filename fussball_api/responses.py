@@ -0,0 +1,28 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class PydanticResponse(ORJSONResponse):
+    """
+    Response class that serializes Pydantic models directly.
+
+    FastAPI's default path runs every returned model through
+    jsonable_encoder (a full Python tree walk) before encoding. Rendering
+    via model_dump_json / orjson keeps the serialization in Rust/C code,
+    which roughly halves the CPU cost of the nested club responses.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        if isinstance(content, list):
+            return orjson.dumps(
+                [
+                    item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+                    for item in content
+                ]
+            )
+        return orjson.dumps(content)
@@ -1,7 +1,8 @@
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class ApiUrl(BaseModel):
@@ -43,10 +44,12 @@ class ClubSearchResult(BaseModel):
     logo_url: str
     city: str
 
-    @property
+    @computed_field
+    @cached_property
     def api(self) -> ClubApiUrl:
         """
-        Generates API URLs for the club.
+        Generates API URLs for the club. Built once per instance; repeated
+        serializations of the same result reuse the cached object.
         """
         return ClubApiUrl(
             teams=f"/api/club/{self.id}/teams",
@@ -71,10 +74,12 @@ class Team(BaseModel):
     name: str
     fussball_de_url: str
 
-    @property
+    @computed_field
+    @cached_property
     def api(self) -> ApiUrl:
         """
-        Generates API URLs for the team.
+        Generates API URLs for the team. Built once per instance; repeated
+        serializations of the same team reuse the cached object.
         """
         return ApiUrl(
             next_games=f"/api/team/{self.id}/next_games",
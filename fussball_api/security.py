@@ -1,16 +1,25 @@
+import hmac
+
 from fastapi import Header, HTTPException, status
 
 from .config import settings
 
+# Bound once at import: the comparison runs on every authenticated request,
+# and a module constant skips the pydantic-settings attribute dispatch.
+_EXPECTED_KEY = settings.API_KEY.encode()
+
 
 async def get_api_key(api_key: str = Header(..., alias="X-API-Key")):
     """
     Dependency function to verify the API key from the request header.
 
+    Uses hmac.compare_digest so the comparison takes constant time and does
+    not leak key prefixes through timing.
+
     :param api_key: The API key passed in the 'X-API-Key' header.
     :raises HTTPException: If the API key is invalid.
     """
-    if api_key != settings.API_KEY:
+    if not hmac.compare_digest(api_key.encode(), _EXPECTED_KEY):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API Key",
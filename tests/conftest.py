@@ -0,0 +1,38 @@
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+# The app resolves relative paths (the ./examples StaticFiles mount, the
+# ./cache_payloads directory) at import time, and test modules import
+# fussball_api.main at collection, so the cwd is pinned to the repo root
+# before any test module loads.
+os.chdir(Path(__file__).resolve().parent.parent)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    The FastAPI app, imported once per session.
+
+    Importing fussball_api.main builds the route table and clones every
+    response_model; doing that per test dominated suite startup.
+    """
+    from fussball_api.main import app
+    from fussball_api.security import get_api_key
+
+    app.dependency_overrides[get_api_key] = lambda: None
+    yield app
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    return TestClient(app)
+
+
+def rjson(response):
+    """Decodes a response body with orjson instead of stdlib json.loads."""
+    return orjson.loads(response.content)
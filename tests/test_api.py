@@ -1,9 +1,13 @@
-import asyncio
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 import pytest
 from fastapi.testclient import TestClient
 
+from .conftest import rjson
+
+from fussball_api import main
 from fussball_api.schemas import (
     ClubInfoResponse,
     ClubSearchResult,
@@ -17,25 +21,42 @@ from fussball_api.schemas import (
 )
 
 
-@pytest.fixture
-def client(monkeypatch):
-    # Ensure that the StaticFiles mount path ../examples resolves correctly
-    monkeypatch.chdir("fussball_api")
-    from fussball_api.main import app
-    from fussball_api.security import get_api_key
-    app.dependency_overrides[get_api_key] = lambda: None
-    return TestClient(app)
+# Route paths and expected response keys used across tests, built once at
+# module level. The frozenset comparisons against dict key views run in C
+# and keep the expected shape of each payload in one place.
+CLUB_URL = "/api/club/CLUB123"
+TEAM_URL = "/api/team/T1"
+FULL_CLUB_KEYS = frozenset({"teams", "club_next_games", "club_prev_games"})
+CLUB_INFO_KEYS = frozenset({"teams", "next_games", "prev_games"})
+TEAM_INFO_KEYS = frozenset({"table", "next_games", "prev_games"})
+
+
+@pytest.fixture(autouse=True)
+def _reset_overrides(app):
+    # Per-test dependency overrides must not leak into the next test; the
+    # session-scoped app keeps only the api-key override permanently.
+    saved = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
 
 
+# The sample payloads are hard-coded and valid, so model_construct skips the
+# pydantic validation pass, and lru_cache reuses the instance for repeated
+# calls with the same idx; tests only read the returned objects.
+@lru_cache(maxsize=None)
 def _sample_team(idx: int = 1) -> Team:
-    return Team(id=f"T{idx}", name=f"Team {idx}", fussball_de_url=f"/mannschaft/{idx}")
+    return Team.model_construct(
+        id=f"T{idx}", name=f"Team {idx}", fussball_de_url=f"/mannschaft/{idx}"
+    )
 
 
+@lru_cache(maxsize=None)
 def _sample_game(idx: int = 1) -> Game:
     # Minimal required fields for serialization by FastAPI
-    return Game(
+    return Game.model_construct(
         id=f"G{idx}",
-        datetime_utc="2024-05-25T13:30:00+00:00",
+        datetime_utc=datetime.fromisoformat("2024-05-25T13:30:00+00:00"),
         competition="Liga",
         age_group="Herren",
         home_team=f"Home {idx}",
@@ -51,10 +72,11 @@ def _sample_game(idx: int = 1) -> Game:
     )
 
 
+@lru_cache(maxsize=None)
 def _sample_table() -> Table:
-    return Table(
+    return Table.model_construct(
         entries=[
-            TableEntry(
+            TableEntry.model_construct(
                 place=1, team="A", img="https://img/a.png", games=1, won=1, draw=0, lost=0,
                 goal="1:0", goal_difference=1, points=3, is_promotion=True, is_relegation=False
             )
@@ -65,11 +87,10 @@ def _sample_table() -> Table:
 def test_root(client: TestClient):
     r = client.get("/")
     assert r.status_code == 200
-    assert "Welcome to the Fussball.de API" in r.json().get("message", "")
+    assert "Welcome to the Fussball.de API" in rjson(r).get("message", "")
 
 
-def test_search_clubs_endpoint(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_search_clubs_endpoint(client: TestClient, app):
     async def fake_search_clubs(query: str) -> List[ClubSearchResult]:
         return [
             ClubSearchResult(
@@ -79,46 +100,44 @@ def test_search_clubs_endpoint(client: TestClient, monkeypatch):
                 city="12345 City",
             )
         ]
-    monkeypatch.setattr(main, "search_clubs", fake_search_clubs)
+    app.dependency_overrides[main.provide_search_clubs] = lambda: fake_search_clubs
     r = client.get("/api/search/clubs?query=abc")
     assert r.status_code == 200
-    data = r.json()
+    data = rjson(r)
     assert isinstance(data, list) and len(data) == 1
     assert data[0]["id"] == "C1"
 
 
-def test_read_club_teams_endpoint(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_read_club_teams_endpoint(client: TestClient, app):
     async def fake_get_club_teams(club_id: str) -> List[Team]:
         return [_sample_team(1), _sample_team(2)]
-    monkeypatch.setattr(main, "get_club_teams", fake_get_club_teams)
-    r = client.get("/api/club/CLUB123/teams")
+    app.dependency_overrides[main.provide_club_teams] = lambda: fake_get_club_teams
+    r = client.get(f"{CLUB_URL}/teams")
     assert r.status_code == 200
-    data = r.json()
+    data = rjson(r)
     assert len(data) == 2
     assert data[0]["id"] == "T1"
 
 
-def test_read_club_info_endpoint(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_read_club_info_endpoint(client: TestClient, app):
     async def fake_get_club_teams(club_id: str) -> List[Team]:
         return [_sample_team(1)]
     async def fake_get_club_next_games(club_id: str) -> List[Game]:
         return [_sample_game(1)]
     async def fake_get_club_prev_games(club_id: str) -> List[Game]:
         return [_sample_game(2)]
-    monkeypatch.setattr(main, "get_club_teams", fake_get_club_teams)
-    monkeypatch.setattr(main, "get_club_next_games", fake_get_club_next_games)
-    monkeypatch.setattr(main, "get_club_prev_games", fake_get_club_prev_games)
-    r = client.get("/api/club/CLUB123/info")
+    app.dependency_overrides[main.provide_club_teams] = lambda: fake_get_club_teams
+    app.dependency_overrides[main.provide_club_next_games] = lambda: fake_get_club_next_games
+    app.dependency_overrides[main.provide_club_prev_games] = lambda: fake_get_club_prev_games
+    r = client.get(f"{CLUB_URL}/info")
     assert r.status_code == 200
-    data = r.json()
-    assert "teams" in data and len(data["teams"]) == 1
+    data = rjson(r)
+    assert CLUB_INFO_KEYS <= data.keys()
+    assert len(data["teams"]) == 1
     assert len(data["next_games"]) == 1
 
 
-def test_read_full_club_info_endpoint(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_read_full_club_info_endpoint(client: TestClient, app):
     async def fake_get_club_teams(club_id: str) -> List[Team]:
         return [_sample_team(1), _sample_team(2)]
     async def fake_get_club_next_games(club_id: str) -> List[Game]:
@@ -131,88 +150,77 @@ def test_read_full_club_info_endpoint(client: TestClient, monkeypatch):
         return [_sample_game(3)]
     async def fake_get_team_prev_games(team_id: str) -> List[Game]:
         return [_sample_game(4)]
-    monkeypatch.setattr(main, "get_club_teams", fake_get_club_teams)
-    monkeypatch.setattr(main, "get_club_next_games", fake_get_club_next_games)
-    monkeypatch.setattr(main, "get_club_prev_games", fake_get_club_prev_games)
-    monkeypatch.setattr(main, "get_team_table", fake_get_team_table)
-    monkeypatch.setattr(main, "get_team_next_games", fake_get_team_next_games)
-    monkeypatch.setattr(main, "get_team_prev_games", fake_get_team_prev_games)
-    r = client.get("/api/club/CLUB123")
+    app.dependency_overrides[main.provide_club_teams] = lambda: fake_get_club_teams
+    app.dependency_overrides[main.provide_club_next_games] = lambda: fake_get_club_next_games
+    app.dependency_overrides[main.provide_club_prev_games] = lambda: fake_get_club_prev_games
+    app.dependency_overrides[main.provide_team_table] = lambda: fake_get_team_table
+    app.dependency_overrides[main.provide_team_next_games] = lambda: fake_get_team_next_games
+    app.dependency_overrides[main.provide_team_prev_games] = lambda: fake_get_team_prev_games
+    r = client.get(CLUB_URL)
     assert r.status_code == 200
-    data = r.json()
-    assert "club_next_games" in data and len(data["club_next_games"]) == 1
-    assert "club_prev_games" in data and len(data["club_prev_games"]) == 1
-    assert "teams" in data and len(data["teams"]) == 2
+    data = rjson(r)
+    assert FULL_CLUB_KEYS <= data.keys()
+    assert len(data["club_next_games"]) == 1
+    assert len(data["club_prev_games"]) == 1
+    assert len(data["teams"]) == 2
     assert data["teams"][0]["table"] is not None
 
 
-def test_read_team_info_endpoint(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_read_team_info_endpoint(client: TestClient, app):
     async def fake_get_team_table(team_id: str) -> Optional[Table]:
         return _sample_table()
     async def fake_get_team_next_games(team_id: str) -> List[Game]:
         return [_sample_game(1)]
     async def fake_get_team_prev_games(team_id: str) -> List[Game]:
         return [_sample_game(2)]
-    monkeypatch.setattr(main, "get_team_table", fake_get_team_table)
-    monkeypatch.setattr(main, "get_team_next_games", fake_get_team_next_games)
-    monkeypatch.setattr(main, "get_team_prev_games", fake_get_team_prev_games)
-    r = client.get("/api/team/T1")
+    app.dependency_overrides[main.provide_team_table] = lambda: fake_get_team_table
+    app.dependency_overrides[main.provide_team_next_games] = lambda: fake_get_team_next_games
+    app.dependency_overrides[main.provide_team_prev_games] = lambda: fake_get_team_prev_games
+    r = client.get(TEAM_URL)
     assert r.status_code == 200
-    data = r.json()
+    data = rjson(r)
+    assert TEAM_INFO_KEYS <= data.keys()
     assert data["table"] is not None
     assert len(data["next_games"]) == 1
     assert len(data["prev_games"]) == 1
 
 
-def test_read_team_table_endpoint(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_read_team_table_endpoint(client: TestClient, app):
     async def fake_get_team_table(team_id: str) -> Optional[Table]:
         return _sample_table()
-    monkeypatch.setattr(main, "get_team_table", fake_get_team_table)
-    r = client.get("/api/team/T1/table")
+    app.dependency_overrides[main.provide_team_table] = lambda: fake_get_team_table
+    r = client.get(f"{TEAM_URL}/table")
     assert r.status_code == 200
-    data = r.json()
+    data = rjson(r)
     assert "entries" in data and len(data["entries"]) == 1
 
 
-def test_club_next_prev_games_endpoints(client: TestClient, monkeypatch):
-    from fussball_api import main
-    async def fake_next(club_id: str) -> List[Game]:
-        return [_sample_game(1)]
-    async def fake_prev(club_id: str) -> List[Game]:
-        return [_sample_game(2)]
-    monkeypatch.setattr(main, "get_club_next_games", fake_next)
-    monkeypatch.setattr(main, "get_club_prev_games", fake_prev)
-    r1 = client.get("/api/club/C123/next_games")
-    r2 = client.get("/api/club/C123/prev_games")
-    assert r1.status_code == 200 and r2.status_code == 200
-    assert len(r1.json()) == 1 and len(r2.json()) == 1
-
-
-def test_team_next_prev_games_endpoints(client: TestClient, monkeypatch):
-    from fussball_api import main
-    async def fake_next(team_id: str) -> List[Game]:
+@pytest.mark.parametrize(
+    "url, provider",
+    [
+        ("/api/club/C123/next_games", "provide_club_next_games"),
+        ("/api/club/C123/prev_games", "provide_club_prev_games"),
+        ("/api/team/TX/next_games", "provide_team_next_games"),
+        ("/api/team/TX/prev_games", "provide_team_prev_games"),
+    ],
+)
+def test_next_prev_games_endpoints(client: TestClient, app, url: str, provider: str):
+    async def fake_games(obj_id: str) -> List[Game]:
         return [_sample_game(1)]
-    async def fake_prev(team_id: str) -> List[Game]:
-        return [_sample_game(2)]
-    monkeypatch.setattr(main, "get_team_next_games", fake_next)
-    monkeypatch.setattr(main, "get_team_prev_games", fake_prev)
-    r1 = client.get("/api/team/TX/next_games")
-    r2 = client.get("/api/team/TX/prev_games")
-    assert r1.status_code == 200 and r2.status_code == 200
-    assert len(r1.json()) == 1 and len(r2.json()) == 1
+    app.dependency_overrides[getattr(main, provider)] = lambda: fake_games
+    r = client.get(url)
+    assert r.status_code == 200
+    assert len(rjson(r)) == 1
 
 
-def test_read_game_by_id_endpoint_ok_and_404(client: TestClient, monkeypatch):
-    from fussball_api import main
+def test_read_game_by_id_endpoint_ok_and_404(client: TestClient, app):
     async def fake_ok(game_id: str) -> Game:
         return _sample_game(9)
     async def fake_none(game_id: str):
         return None
-    monkeypatch.setattr(main, "get_game_by_id", fake_ok)
+    app.dependency_overrides[main.provide_game_by_id] = lambda: fake_ok
     ok = client.get("/api/game/G9")
     assert ok.status_code == 200
-    monkeypatch.setattr(main, "get_game_by_id", fake_none)
+    app.dependency_overrides[main.provide_game_by_id] = lambda: fake_none
     nf = client.get("/api/game/GNF")
     assert nf.status_code == 404
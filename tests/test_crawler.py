@@ -1,9 +1,10 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from fussball_api.cache import http_cache, FetchedResponse
+from fussball_api.cache import http_cache, negative_cache, FetchedResponse
 import httpx
 
+from fussball_api import crawler
+
 from fussball_api.crawler import (
     _get_font_mapping,
     get_club_teams,
@@ -15,13 +16,55 @@ from fussball_api.crawler import (
 from fussball_api.schemas import ClubSearchResult, Game, Table, Team
 
 
-@pytest.fixture(autouse=True)
-def clear_caches():
-    """Fixture to clear all caches before each test."""
+@pytest.fixture
+def clear_http_cache():
+    """
+    Opt-in fixture for tests that assert on HTTP/font cache behaviour.
+
+    Most crawler tests mock fetch_url and never touch the caches, so wiping
+    them for every test only added fixture overhead; only the font-mapping
+    tests, which read and write cache entries, request it.
+    """
     http_cache.clear()
+    negative_cache.clear()
+    crawler._FONT_PARSE_CACHE.clear()
 
 
-@pytest.fixture
+# Codepoint-to-digit map for the obfuscated score glyphs in prev_games_html,
+# spelled out once at module level; mappings are int-keyed end to end, so no
+# per-character hex formatting happens anywhere.
+SCORE_FONT_MAP = {0xE001: "1", 0xE002: "2"}
+
+
+def astub(value):
+    """
+    Returns an async callable that always returns ``value``.
+
+    Stands in for AsyncMock in the common fixed-return case; every call is
+    recorded on ``.calls`` as an (args, kwargs) tuple so tests can still
+    assert on invocations without the mock descriptor machinery.
+    """
+    async def _stub(*args, **kwargs):
+        _stub.calls.append((args, kwargs))
+        return value
+
+    _stub.calls = []
+    return _stub
+
+
+def aseq(*values):
+    """Like astub, but returns the given values one per call, in order."""
+    it = iter(values)
+
+    async def _stub(*args, **kwargs):
+        _stub.calls.append((args, kwargs))
+        return next(it)
+
+    _stub.calls = []
+    return _stub
+
+
+@pytest.fixture(scope="session")
 def club_teams_html():
     """Sample HTML for testing get_club_teams."""
     return """
@@ -34,7 +77,7 @@ def club_teams_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def team_table_html():
     """Sample HTML for testing get_team_table."""
     return """
@@ -68,7 +111,7 @@ def team_table_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prev_games_html():
     """
     Sample HTML for testing _get_games.
@@ -116,7 +159,7 @@ def prev_games_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def game_details_html():
     """Sample HTML for game details page to extract location."""
     return """
@@ -129,7 +172,7 @@ def game_details_html():
     """
  
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def club_search_html():
     """Sample HTML for testing search_clubs."""
     return """
@@ -150,15 +193,55 @@ def club_search_html():
     """
 
 
+# Pre-built responses for the immutable HTML fixtures above. Built once per
+# session, so tests skip re-encoding the same HTML and re-constructing the
+# response object on every run.
+@pytest.fixture(scope="session")
+def club_teams_fetched(club_teams_html):
+    return FetchedResponse(
+        url="u", status_code=200, headers={}, content=club_teams_html.encode("utf-8"),
+        text=club_teams_html,
+    )
+
+
+@pytest.fixture(scope="session")
+def team_table_fetched(team_table_html):
+    return FetchedResponse(
+        url="u", status_code=200, headers={}, content=team_table_html.encode("utf-8"),
+        text=team_table_html,
+    )
+
+
+@pytest.fixture(scope="session")
+def prev_games_fetched(prev_games_html):
+    return FetchedResponse(
+        url="list", status_code=200, headers={}, content=prev_games_html.encode("utf-8"),
+        text=prev_games_html,
+    )
+
+
+@pytest.fixture(scope="session")
+def game_details_fetched(game_details_html):
+    return FetchedResponse(
+        url="/spiel/123", status_code=200, headers={},
+        content=game_details_html.encode("utf-8"), text=game_details_html,
+    )
+
+
+@pytest.fixture(scope="session")
+def club_search_fetched(club_search_html):
+    return FetchedResponse(
+        url="u", status_code=200, headers={}, content=club_search_html.encode("utf-8"),
+        text=club_search_html,
+    )
+
+
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_club_teams(mock_fetch, club_teams_html):
+async def test_get_club_teams(monkeypatch, club_teams_fetched):
     """Tests the parsing of club teams."""
     # Arrange
-    mock_fetch.return_value = FetchedResponse(
-        url="u", status_code=200, headers={}, content=club_teams_html.encode("utf-8"),
-        text=club_teams_html
-    )
+    fetch = astub(club_teams_fetched)
+    monkeypatch.setattr(crawler, "fetch_url", fetch)
 
     # Act
     teams = await get_club_teams("test_club_id")
@@ -177,18 +260,14 @@ async def test_get_club_teams(mock_fetch, club_teams_html):
     assert teams[1].id == "1A2B3C4D5E6F7G8H9I0J1K2L3M4N5O6P"
     assert teams[1].name == "Team B"
 
-    mock_fetch.assert_called_once()
+    assert len(fetch.calls) == 1
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_team_table(mock_fetch, team_table_html):
+async def test_get_team_table(monkeypatch, team_table_fetched):
     """Tests the parsing of a team's league table."""
     # Arrange
-    mock_fetch.return_value = FetchedResponse(
-        url="u", status_code=200, headers={}, content=team_table_html.encode("utf-8"),
-        text=team_table_html
-    )
+    monkeypatch.setattr(crawler, "fetch_url", astub(team_table_fetched))
 
     # Act
     table = await get_team_table("test_team_id")
@@ -220,13 +299,11 @@ async def test_get_team_table(mock_fetch, team_table_html):
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_team_table_no_content(mock_fetch):
+async def test_get_team_table_no_content(monkeypatch):
     """Tests handling of an empty response for a team table."""
     # Arrange
-    mock_fetch.return_value = FetchedResponse(
-        url="u", status_code=200, headers={}, content=b"", text=""
-    )
+    empty = FetchedResponse(url="u", status_code=200, headers={}, content=b"", text="")
+    monkeypatch.setattr(crawler, "fetch_url", astub(empty))
 
     # Act
     table = await get_team_table("test_team_id")
@@ -236,53 +313,80 @@ async def test_get_team_table_no_content(mock_fetch):
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.ttLib.TTFont")
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_font_mapping(mock_fetch, mock_ttfont):
+async def test_get_font_mapping(monkeypatch, clear_http_cache):
     """Tests the score deobfuscation font mapping logic."""
     # Arrange
-    # Mock the HTTP response for the font file
-    mock_fetch.return_value = FetchedResponse(
-        url="u", status_code=200, headers={}, content=b"woff-content", text=None
+    # Stub the HTTP response for the font file
+    fetch = astub(
+        FetchedResponse(url="u", status_code=200, headers={}, content=b"woff-content", text=None)
     )
+    monkeypatch.setattr(crawler, "fetch_url", fetch)
+
+    # Stub the font parsing library
+    cmap = {0x61: "one", 0x62: "two", 0x3A: "hyphen", 0x99: "unknown"}
+    fonts = []
 
-    # Mock the font parsing library
-    mock_font_instance = MagicMock()
-    mock_cmap = {0x61: "one", 0x62: "two", 0x3A: "hyphen", 0x99: "unknown"}
-    mock_font_instance.getBestCmap.return_value = mock_cmap
-    mock_ttfont.return_value = mock_font_instance
+    class FakeFont:
+        def __init__(self, *args, **kwargs):
+            fonts.append(args)
+
+        def getBestCmap(self):
+            return cmap
+
+    monkeypatch.setattr(crawler.ttLib, "TTFont", FakeFont)
 
     # Act
     mapping = await _get_font_mapping("test-font")
 
     # Assert
-    assert mapping == {"61": "1", "62": "2", "3a": ":"}
-    mock_fetch.assert_called_once()
-    mock_ttfont.assert_called_once()
+    assert mapping == {0x61: "1", 0x62: "2", 0x3A: ":"}
+    assert len(fetch.calls) == 1
+    assert len(fonts) == 1
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler._get_match_course", new_callable=AsyncMock)
-@patch("fussball_api.crawler._get_font_mapping", new_callable=AsyncMock)
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_team_prev_games(
-    mock_fetch, mock_get_font_mapping, mock_get_match_course, prev_games_html, game_details_html
-):
+async def test_get_font_mapping_reuses_parse_for_identical_bytes(monkeypatch, clear_http_cache):
+    """Identical WOFF bytes under different font names are parsed only once."""
+    woff = FetchedResponse(
+        url="u", status_code=200, headers={}, content=b"same-woff-bytes", text=None
+    )
+    monkeypatch.setattr(crawler, "fetch_url", astub(woff))
+
+    cmap = {0x61: "one"}
+    fonts = []
+
+    class FakeFont:
+        def __init__(self, *args, **kwargs):
+            fonts.append(args)
+
+        def getBestCmap(self):
+            return cmap
+
+    monkeypatch.setattr(crawler.ttLib, "TTFont", FakeFont)
+
+    first = await _get_font_mapping("font-a")
+    second = await _get_font_mapping("font-b")
+
+    assert first == second == {0x61: "1"}
+    assert len(fonts) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_team_prev_games(monkeypatch, prev_games_fetched, game_details_fetched):
     """Tests the complex parsing of previous games, including score deobfuscation."""
     # Arrange
-    # Mock the sequence of HTTP responses: games list, details for game 1, details for game 2
-    mock_fetch.side_effect = [
-        FetchedResponse(url="list", status_code=200, headers={}, content=prev_games_html.encode("utf-8"), text=prev_games_html),
-        FetchedResponse(url="/spiel/123", status_code=200, headers={}, content=game_details_html.encode("utf-8"), text=game_details_html),
+    # Stub the sequence of HTTP responses: games list, details for game 1, details for game 2
+    fetch = aseq(
+        prev_games_fetched,
+        game_details_fetched,
         FetchedResponse(url="/spiel/456", status_code=404, headers={}, content=b"", text="Not Found"),
-    ]
+    )
+    monkeypatch.setattr(crawler, "fetch_url", fetch)
 
-    # Mock the font mapping result
-    mock_get_font_mapping.return_value = {
-        f"{ord('\ue001'):x}": "1",
-        f"{ord('\ue002'):x}": "2",
-    }
-    mock_get_match_course.return_value = []
+    # Stub the font mapping result
+    font_mapping = astub(SCORE_FONT_MAP)
+    monkeypatch.setattr(crawler, "_get_font_mapping", font_mapping)
+    monkeypatch.setattr(crawler, "_get_match_course", astub([]))
 
     # Act
     games = await get_team_prev_games("test_team_id")
@@ -319,24 +423,20 @@ async def test_get_team_prev_games(
     assert game2.location is None
     assert game2.location_url is None
 
-    mock_get_font_mapping.assert_called_once_with("score-font-123")
-    assert mock_fetch.call_count == 3
-    assert mock_fetch.call_args_list[0].args[0].endswith(
+    assert font_mapping.calls == [(("score-font-123",), {})]
+    assert len(fetch.calls) == 3
+    assert fetch.calls[0][0][0].endswith(
         "/ajax.team.prev.games/-/mode/PAGE/team-id/test_team_id"
     )
-    assert mock_fetch.call_args_list[1].args[0] == "/spiel/123"
-    assert mock_fetch.call_args_list[2].args[0] == "/spiel/456"
+    assert fetch.calls[1][0][0] == "/spiel/123"
+    assert fetch.calls[2][0][0] == "/spiel/456"
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.fetch_url")
-async def test_search_clubs(mock_fetch, club_search_html):
+async def test_search_clubs(monkeypatch, club_search_fetched):
     """Tests the parsing of club search results."""
     # Arrange
-    mock_fetch.return_value = FetchedResponse(
-        url="u", status_code=200, headers={}, content=club_search_html.encode("utf-8"),
-        text=club_search_html
-    )
+    monkeypatch.setattr(crawler, "fetch_url", astub(club_search_fetched))
 
     # Act
     clubs = await search_clubs("test")
@@ -352,8 +452,7 @@ async def test_search_clubs(mock_fetch, club_search_html):
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_match_course_parses_events(mock_fetch):
+async def test_get_match_course_parses_events(monkeypatch):
     """Tests that match events are parsed correctly into MatchEvent objects."""
     # Arrange: simulate HTML with one goal event
     html = """
@@ -365,9 +464,10 @@ async def test_get_match_course_parses_events(mock_fetch):
         </div>
     </div>
     """
-    mock_fetch.return_value = FetchedResponse(
+    resp = FetchedResponse(
         url="u", status_code=200, headers={}, content=html.encode("utf-8"), text=html
     )
+    monkeypatch.setattr(crawler, "fetch_url", astub(resp))
 
     from fussball_api.crawler import _get_match_course
 
@@ -385,17 +485,17 @@ async def test_get_match_course_parses_events(mock_fetch):
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler._get_font_mapping", new_callable=AsyncMock)
-async def test_deobfuscate_player_name(mock_get_font_mapping):
+async def test_deobfuscate_player_name(monkeypatch):
     """Tests that obfuscated player names are decoded via font mapping."""
     from bs4 import BeautifulSoup
 
-    mock_get_font_mapping.return_value = {
-        f"{ord(''):x}": "N",
-        f"{ord(''):x}": "i",
-        f"{ord(''):x}": "c",
-        f"{ord(''):x}": "o",
-    }
+    font_mapping = astub({
+        ord(''): "N",
+        ord(''): "i",
+        ord(''): "c",
+        ord(''): "o",
+    })
+    monkeypatch.setattr(crawler, "_get_font_mapping", font_mapping)
 
     html = '<span data-obfuscation="font123"></span>'
     span = BeautifulSoup(html, "lxml").find("span")
@@ -403,17 +503,14 @@ async def test_deobfuscate_player_name(mock_get_font_mapping):
     decoded = await _deobfuscate_text(span)
 
     assert decoded == "Nico"
-    mock_get_font_mapping.assert_called_once_with("font123")
+    assert font_mapping.calls == [(("font123",), {})]
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler._get_font_mapping", new_callable=AsyncMock)
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_match_course_with_obfuscated_player(
-    mock_fetch, mock_get_font_mapping
-):
+async def test_get_match_course_with_obfuscated_player(monkeypatch):
     """Tests that _get_match_course decodes obfuscated player names via font mapping."""
-    mock_get_font_mapping.return_value = {f"{ord(''):x}": "A"}
+    font_mapping = astub({ord(''): "A"})
+    monkeypatch.setattr(crawler, "_get_font_mapping", font_mapping)
 
     html = """
     <div id="match_course_body">
@@ -424,9 +521,10 @@ async def test_get_match_course_with_obfuscated_player(
         </div>
     </div>
     """
-    mock_fetch.return_value = FetchedResponse(
+    resp = FetchedResponse(
         url="u", status_code=200, headers={}, content=html.encode("utf-8"), text=html
     )
+    monkeypatch.setattr(crawler, "fetch_url", astub(resp))
 
     from fussball_api.crawler import _get_match_course
     events = await _get_match_course("game123")
@@ -434,109 +532,122 @@ async def test_get_match_course_with_obfuscated_player(
     assert len(events) == 1
     ev = events[0]
     assert ev.description == "A"
-    mock_get_font_mapping.assert_called_once_with("font123")
+    assert font_mapping.calls == [(("font123",), {})]
 
 
 from bs4 import BeautifulSoup
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler.fetch_url")
-async def test_get_font_mapping_fails_and_empty(mock_fetch):
-    mock_fetch.return_value = FetchedResponse(
-        url="u", status_code=404, headers={}, content=b"", text="Not Found"
-    )
+async def test_get_font_mapping_fails_and_empty(monkeypatch, clear_http_cache):
+    not_found = FetchedResponse(url="u", status_code=404, headers={}, content=b"", text="Not Found")
+    monkeypatch.setattr(crawler, "fetch_url", astub(not_found))
     mapping = await _get_font_mapping("bad-font")
     assert mapping == {}
 
 
 @pytest.mark.asyncio
-async def test_get_font_mapping_cache_hit(monkeypatch):
-    from fussball_api import crawler
+async def test_get_font_mapping_cache_hit(monkeypatch, clear_http_cache):
     crawler.http_cache["font:cached-font"] = crawler.HttpCacheEntry(
         url="dummy",
         final_url="dummy",
         status_code=200,
         headers={},
-        content={"61": "1"},
+        content={0x61: "1"},
         text=None,
     )
     result = await crawler._get_font_mapping("cached-font")
-    assert result == {"61": "1"}
+    assert result == {0x61: "1"}
+
+
+@pytest.fixture(scope="module")
+def span_factory():
+    """
+    Parses a snippet with lxml and returns its first <span>.
+
+    The deobfuscation tests only need one element; going through lxml
+    directly skips building a BeautifulSoup tree per test.
+    """
+    from lxml import html as lxml_html
+
+    return lambda snippet: lxml_html.fromstring(snippet).xpath("//span")[0]
 
 
 @pytest.mark.asyncio
-async def test_deobfuscate_text_no_obfuscation():
-    html = "<span>Hello</span>"
-    span = BeautifulSoup(html, "lxml").find("span")
+async def test_deobfuscate_text_lxml_element(monkeypatch, span_factory):
+    """_deobfuscate_text also accepts bare lxml elements, without bs4 wrappers."""
+    monkeypatch.setattr(crawler, "_get_font_mapping", astub({0xE001: "7"}))
+
+    span = span_factory('<span data-obfuscation="fontL"></span>')
     decoded = await _deobfuscate_text(span)
-    assert decoded == "Hello"
+
+    assert decoded == "7"
 
 
 @pytest.mark.asyncio
-@patch("fussball_api.crawler._get_font_mapping", new_callable=AsyncMock)
-async def test_deobfuscate_text_unknown_char(mock_get_font_mapping):
-    mock_get_font_mapping.return_value = {}
-    html = '<span data-obfuscation="fontX">X</span>'
-    span = BeautifulSoup(html, "lxml").find("span")
+async def test_deobfuscate_text_no_obfuscation(span_factory):
+    span = span_factory("<span>Hello</span>")
     decoded = await _deobfuscate_text(span)
-    assert decoded == "X"
+    assert decoded == "Hello"
 
 
 @pytest.mark.asyncio
-async def test_fetch_response_handles_requesterror(monkeypatch):
-    from fussball_api.cache import fetch_url
+async def test_deobfuscate_text_unknown_char(monkeypatch, span_factory):
+    monkeypatch.setattr(crawler, "_get_font_mapping", astub({}))
+    span = span_factory('<span data-obfuscation="fontX">X</span>')
+    decoded = await _deobfuscate_text(span)
+    assert decoded == "X"
 
-    class FakeClient:
-        def __init__(self, **kw): pass
-        def __enter__(self): return self
-        def __exit__(self, exc_type, exc_val, exc_tb): pass
-        def request(self, *a, **kw):
-            raise httpx.RequestError("boom", request=httpx.Request("GET","x"))
 
-    monkeypatch.setattr(httpx, "Client", lambda **kw: FakeClient())
-    resp = fetch_url("url")
-    assert resp is None
+@pytest.mark.asyncio
+@pytest.mark.parametrize("behavior, expected_status", [("raise", None), ("500", 500)])
+async def test_fetch_url_error_handling(monkeypatch, clear_http_cache, behavior, expected_status):
+    """fetch_url returns None on transport errors and passes through HTTP 500s."""
+    from fussball_api import cache
 
+    class FakeStream:
+        async def __aenter__(self):
+            return httpx.Response(500, request=httpx.Request("GET", "x"))
 
-@pytest.mark.asyncio
-async def test_fetch_response_handles_httpstatuserror(monkeypatch):
-    from fussball_api.cache import fetch_url
+        async def __aexit__(self, *exc):
+            return False
 
     class FakeClient:
-        def __init__(self, **kw): pass
-        def __enter__(self): return self
-        def __exit__(self, exc_type, exc_val, exc_tb): pass
-        def request(self, *a, **kw):
-            return httpx.Response(500, request=httpx.Request("GET","x"))
+        def stream(self, *a, **kw):
+            if behavior == "raise":
+                raise httpx.RequestError("boom", request=httpx.Request("GET", "x"))
+            return FakeStream()
 
-    monkeypatch.setattr(httpx, "Client", lambda **kw: FakeClient())
-    resp = fetch_url("url")
-    assert resp is not None
-    assert resp.status_code == 500
+    monkeypatch.setattr(cache, "_ASYNC_CLIENT", FakeClient())
+    resp = await cache.fetch_url(f"url-{behavior}")
+    if expected_status is None:
+        assert resp is None
+    else:
+        assert resp is not None
+        assert resp.status_code == expected_status
 
 
 @pytest.mark.asyncio
 async def test_get_game_by_id_no_stage(monkeypatch):
-    from fussball_api import crawler
-    def fake_fetch_sync(*a, **k):
-        return FetchedResponse(url="u", status_code=200, headers={}, content=b"<html></html>", text="<html></html>")
-    monkeypatch.setattr(crawler, "fetch_url", fake_fetch_sync)
+    empty_page = FetchedResponse(
+        url="u", status_code=200, headers={}, content=b"<html></html>", text="<html></html>"
+    )
+    monkeypatch.setattr(crawler, "fetch_url", astub(empty_page))
     game = await crawler.get_game_by_id("gid")
     assert game is None
 
 
 @pytest.mark.asyncio
 async def test_get_game_by_id_team_logos_from_img(monkeypatch):
-    from fussball_api import crawler
     html = """
     <section id="stage">
       <div class="team-home"><div class="team-name">A</div><img src="//a.png"></div>
       <div class="team-away"><div class="team-name">B</div><img src="//b.png"></div>
     </section>
     """
-    def fake_fetch_sync(*a, **k):
-        return FetchedResponse(url="u", status_code=200, headers={}, content=html.encode("utf-8"), text=html)
-    monkeypatch.setattr(crawler, "fetch_url", fake_fetch_sync)
+    resp = FetchedResponse(
+        url="u", status_code=200, headers={}, content=html.encode("utf-8"), text=html
+    )
+    monkeypatch.setattr(crawler, "fetch_url", astub(resp))
     game = await crawler.get_game_by_id("gid")
     assert game.home_logo.startswith("https://")
     assert game.away_logo.startswith("https://")
@@ -544,20 +655,18 @@ async def test_get_game_by_id_team_logos_from_img(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_get_team_table_skips_bad_rows(monkeypatch):
-    from fussball_api import crawler
     html = "<table><tr><td>onlyfew</td></tr></table>"
-    def fake_fetch_sync(*a, **k):
-        return FetchedResponse(url="u", status_code=200, headers={}, content=html.encode("utf-8"), text=html)
-    monkeypatch.setattr(crawler, "fetch_url", fake_fetch_sync)
+    resp = FetchedResponse(
+        url="u", status_code=200, headers={}, content=html.encode("utf-8"), text=html
+    )
+    monkeypatch.setattr(crawler, "fetch_url", astub(resp))
     result = await crawler.get_team_table("tid")
     assert result is None
 
 
 @pytest.mark.asyncio
 async def test_search_clubs_no_results(monkeypatch):
-    from fussball_api import crawler
-    def fake_fetch_sync(*a, **k):
-        return FetchedResponse(url="u", status_code=200, headers={}, content=b"", text="<html></html>")
-    monkeypatch.setattr(crawler, "fetch_url", fake_fetch_sync)
+    empty = FetchedResponse(url="u", status_code=200, headers={}, content=b"", text="<html></html>")
+    monkeypatch.setattr(crawler, "fetch_url", astub(empty))
     result = await crawler.search_clubs("abc")
     assert result == []